@@ -1,17 +1,22 @@
 from __future__ import annotations
 
 import argparse
+import atexit
+import functools
+import io
 import json
 import os
 import queue
+import re
 import shutil
 import shlex
 import stat
 import subprocess
+import sys
 import threading
 import time
 import webbrowser
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from string import ascii_uppercase
 from enum import Enum
 from pathlib import Path
@@ -39,6 +44,7 @@ from .clip_utils import (
     analyze_overlaps,
     group_clips_by_video,
     plan_adjacent_merges,
+    prepare_sorted_groups,
     resolve_clips,
     ClipGroup,
     MergeSuggestion,
@@ -66,7 +72,7 @@ from .fileops_plan import (
     validate_plan,
 )
 from .config import AppConfig, load_config, save_config
-from .metadata import VideoMetadata, get_metadata
+from .metadata import VideoMetadata, get_metadata_bundle
 from .paths import config_path, thumbs_cache_dir
 from .parser import ClipSpec, format_clip_file, parse_clip_file
 from .presets import PresetProfile, find_preset, list_presets
@@ -80,14 +86,20 @@ from .resolve import (
 from .exports import (
     build_concat_list,
     build_manifest_entries,
-    manifest_to_csv,
     manifest_to_json,
+    manifest_write_csv,
 )
 from .timeparse import format_seconds
 from .thumbs import download_thumbnail, generate_clip_thumbnail, get_direct_video_url
 from .ui.edit_buffer import PlanPreviewScreen
-from .ui.file_browser import FileEntryKind, file_icon_for_kind, is_hidden, path_sort_key
-from .ui.file_buffer import FileBufferTextArea, strip_icon_prefix
+from .ui.file_browser import (
+    FileEntryKind,
+    file_icon_for_kind,
+    invalidate_hidden_cache,
+    is_hidden,
+    path_sort_key,
+)
+from .ui.file_buffer import FileBufferTextArea, invalidate_resolve_cache, strip_icon_prefix
 from .ui.screens import (
     CommandAction,
     CommandPaletteScreen,
@@ -114,6 +126,10 @@ from .ytdlp_runner import DownloadResult, ProgressUpdate, run_ytdlp_with_progres
 
 DEFAULT_PAD_BEFORE = 1
 DEFAULT_PAD_AFTER = 1
+# Metadata and thumbnail fetches are latency-bound (yt-dlp subprocesses and
+# HTTP downloads), so a small pool of workers drains each queue in parallel.
+METADATA_WORKER_COUNT = 4
+VIDEO_THUMB_WORKER_COUNT = 4
 DEFAULT_MERGE_GAP = 1.0
 DEFAULT_OVERLAP_RATIO = 0.8
 TIP_TEXT = "Tip: press ? for help (and / to search)"
@@ -998,7 +1014,8 @@ class ClipstuiApp(App):
         csv_path = output_dir / f"{base_name}.csv"
         json_path = output_dir / f"{base_name}.json"
         try:
-            csv_path.write_text(manifest_to_csv(entries), encoding="utf-8")
+            with csv_path.open("w", encoding="utf-8", newline="") as csv_file:
+                manifest_write_csv(entries, csv_file)
             json_path.write_text(
                 manifest_to_json(
                     entries,
@@ -1988,11 +2005,16 @@ class ClipstuiApp(App):
                 return
 
             groups = group_clips_by_video(resolved)
+            sorted_groups = prepare_sorted_groups(resolved)
             overlap_index = _index_overlaps(
-                analyze_overlaps(resolved, heavy_overlap_ratio=DEFAULT_OVERLAP_RATIO)
+                analyze_overlaps(
+                    resolved,
+                    heavy_overlap_ratio=DEFAULT_OVERLAP_RATIO,
+                    groups=sorted_groups,
+                )
             )
             merge_suggestions = plan_adjacent_merges(
-                resolved, gap_threshold=DEFAULT_MERGE_GAP
+                resolved, gap_threshold=DEFAULT_MERGE_GAP, groups=sorted_groups
             )
             merge_index = _index_merges(merge_suggestions)
             if resolved:
@@ -2055,6 +2077,8 @@ class ClipstuiApp(App):
         buffer = self._file_buffer
         if buffer is None:
             return
+        invalidate_hidden_cache()
+        invalidate_resolve_cache()
         if self._drive_picker_active:
             lines: list[str] = []
             drives = self._list_drive_roots()
@@ -2087,10 +2111,7 @@ class ClipstuiApp(App):
         parent_line = _format_parent_line(self._tree_root)
         if parent_line:
             lines.append(parent_line)
-        lines.extend(
-            _format_entry_line(self._tree_root, entry, depth, expanded)
-            for entry, depth, expanded in display_entries
-        )
+        lines.extend(_format_entry_lines(display_entries))
         text = "\n".join(lines)
         buffer.text = text
         self._file_buffer_original_text = text
@@ -4491,6 +4512,8 @@ class ClipstuiApp(App):
         return entries
 
     def _resolve_preset_output_dir(self, target: Path) -> Path:
+        if isinstance(target, Path) and target.is_absolute() and "~" not in target.parts[0]:
+            return target
         target = Path(target).expanduser()
         if target.is_absolute():
             return target
@@ -4504,19 +4527,22 @@ class ClipstuiApp(App):
             return clip.output_name
 
     def _apply_preset_profile(self, preset: PresetProfile, *, show_message: bool) -> None:
-        pad_changed = False
+        # Track which fields changed: only a pad change requires re-parsing the
+        # clip file; template/format/dir changes only need a preview re-render.
+        dirty: set[str] = set()
         errors: list[str] = []
         if preset.pad_before is not None:
             self._pad_before_default = preset.pad_before
-            pad_changed = True
+            dirty.add("pad")
         if preset.pad_after is not None:
             self._pad_after_default = preset.pad_after
-            pad_changed = True
+            dirty.add("pad")
         if preset.output_format:
             normalized = _normalize_output_format(preset.output_format)
             if _is_valid_output_format(normalized):
                 self.output_format = normalized
                 self._output_format_override = True
+                dirty.add("format")
             else:
                 errors.append(f"Invalid format: {preset.output_format}")
         if preset.output_template:
@@ -4524,6 +4550,7 @@ class ClipstuiApp(App):
                 validate_output_template(preset.output_template)
                 self.output_template = preset.output_template
                 self._output_template_override = True
+                dirty.add("template")
             except ValueError as exc:
                 errors.append(str(exc))
         if preset.output_dir:
@@ -4532,13 +4559,14 @@ class ClipstuiApp(App):
                 resolved_dir.mkdir(parents=True, exist_ok=True)
                 self.output_dir = resolved_dir
                 self._output_dir_override = True
+                dirty.add("dir")
             except OSError as exc:
                 errors.append(f"Output dir error: {exc}")
 
         self._update_left_status()
-        if pad_changed and self.clip_path:
+        if "pad" in dirty and self.clip_path:
             self.load_clip_file(self.clip_path, select_index=self._clip_list_index)
-        elif self._selected is not None:
+        elif dirty & {"template", "format", "dir"} and self._selected is not None:
             self._set_preview(self._selected)
         if show_message:
             message = f"Preset applied: {preset.name}"
@@ -4589,7 +4617,8 @@ class ClipstuiApp(App):
         if self._metadata_worker_started:
             return
         self._metadata_queue = queue.Queue()
-        threading.Thread(target=self._metadata_worker, daemon=True).start()
+        for _ in range(METADATA_WORKER_COUNT):
+            threading.Thread(target=self._metadata_worker, daemon=True).start()
         self._metadata_worker_started = True
 
     def _metadata_worker(self) -> None:
@@ -4598,7 +4627,11 @@ class ClipstuiApp(App):
         while True:
             video_id, start_url = self._metadata_queue.get()
             try:
-                metadata = get_metadata(start_url)
+                metadata, direct_url = get_metadata_bundle(start_url)
+                if direct_url is not None:
+                    # Seed the thumbnail pipeline so it can skip its own
+                    # yt-dlp -g call for this video.
+                    self._direct_url_cache.setdefault(video_id, direct_url)
                 self.call_from_thread(self._apply_metadata, video_id, metadata, None)
             except Exception as exc:
                 self.call_from_thread(self._apply_metadata, video_id, None, str(exc))
@@ -4655,7 +4688,8 @@ class ClipstuiApp(App):
         if self._video_thumb_worker_started:
             return
         self._video_thumb_queue = queue.LifoQueue()
-        threading.Thread(target=self._video_thumb_worker, daemon=True).start()
+        for _ in range(VIDEO_THUMB_WORKER_COUNT):
+            threading.Thread(target=self._video_thumb_worker, daemon=True).start()
         self._video_thumb_worker_started = True
 
     def _video_thumb_worker(self) -> None:
@@ -5043,71 +5077,61 @@ def _format_preview(
     title = metadata.title if metadata and metadata.title else "--"
     uploader = metadata.uploader if metadata and metadata.uploader else "--"
     duration = _format_duration(metadata.duration) if metadata else None
-    lines: list[str] = []
+    # Stream the preview into a StringIO instead of accumulating a list of
+    # lines and joining; every line carries its own newline and the final
+    # URL line is left bare.
+    buf = io.StringIO()
+    write = buf.write
     if metadata_error:
-        lines.append(f"Metadata error: {_short_error(metadata_error)}")
+        write(f"Metadata error: {_short_error(metadata_error)}\n")
     elif metadata is None:
-        lines.append("Metadata: loading...")
-    lines.extend(
-        [
-            f"Title: {title}",
-            f"Uploader: {uploader}",
-            f"Duration: {_format_preview_value(duration)}",
-            "",
-            f"Tag: {tag}",
-            f"Label: {label_value}",
-            f"Score: {score}",
-            f"Opponent: {opponent}",
-            f"Video ID: {clip.video_id}",
-            f"Start: {int(clip.start_sec // 60)}:{int(clip.start_sec % 60):02}",
-            f"End: {int(clip.end_sec // 60)}:{int(clip.end_sec % 60):02}",
-            f"Cut: {format_seconds(clip.cut_start)}-{format_seconds(clip.cut_end)}",
-            f"Output: {output_name}",
-        ]
+        write("Metadata: loading...\n")
+    write(
+        f"Title: {title}\n"
+        f"Uploader: {uploader}\n"
+        f"Duration: {_format_preview_value(duration)}\n"
+        "\n"
+        f"Tag: {tag}\n"
+        f"Label: {label_value}\n"
+        f"Score: {score}\n"
+        f"Opponent: {opponent}\n"
+        f"Video ID: {clip.video_id}\n"
+        f"Start: {int(clip.start_sec // 60)}:{int(clip.start_sec % 60):02}\n"
+        f"End: {int(clip.end_sec // 60)}:{int(clip.end_sec % 60):02}\n"
+        f"Cut: {format_seconds(clip.cut_start)}-{format_seconds(clip.cut_end)}\n"
+        f"Output: {output_name}\n"
     )
 
     if warnings:
-        lines.append("")
-        lines.append("Warnings:")
+        write("\nWarnings:\n")
         for warning in warnings:
-            lines.append(f"- {_format_overlap_warning(clip, warning)}")
+            write(f"- {_format_overlap_warning(clip, warning)}\n")
 
     if merges:
-        lines.append("")
-        lines.append("Merge candidates:")
+        write("\nMerge candidates:\n")
         for suggestion in merges:
-            lines.append(f"- {_format_merge_hint(clip, suggestion)}")
+            write(f"- {_format_merge_hint(clip, suggestion)}\n")
 
     if item is None:
-        lines.append("")
-        lines.append("Queue: not queued")
+        write("\nQueue: not queued\n")
     else:
-        lines.append("")
-        lines.append(f"Queue: {item.status.value.upper()}")
-        lines.append(f"Progress: {_format_preview_value(_format_percent(item.progress))}")
-        lines.append(f"Speed: {_format_preview_value(_format_speed(item.speed_bps))}")
-        lines.append(f"ETA: {_format_preview_value(_format_eta(item.eta_seconds))}")
+        write(
+            "\n"
+            f"Queue: {item.status.value.upper()}\n"
+            f"Progress: {_format_preview_value(_format_percent(item.progress))}\n"
+            f"Speed: {_format_preview_value(_format_speed(item.speed_bps))}\n"
+            f"ETA: {_format_preview_value(_format_eta(item.eta_seconds))}\n"
+        )
         if item.error:
-            lines.append(f"Error: {_short_error(item.error)}")
+            write(f"Error: {_short_error(item.error)}\n")
 
-    lines.extend(
-        [
-            "",
-            f"Start URL: {clip.clip.start_url}",
-            f"End URL: {clip.clip.end_url}",
-        ]
-    )
-    return "\n".join(lines)
+    write(f"\nStart URL: {clip.clip.start_url}\nEnd URL: {clip.clip.end_url}")
+    return buf.getvalue()
 
 
 def _clip_has_context(clip: ResolvedClip) -> bool:
-    return any(
-        [
-            clip.clip.label,
-            clip.clip.score,
-            clip.clip.opponent,
-        ]
-    )
+    spec = clip.clip
+    return bool(spec.label or spec.score or spec.opponent)
 
 
 def _build_clip_sidecar_payload(
@@ -5116,6 +5140,9 @@ def _build_clip_sidecar_payload(
     metadata: VideoMetadata | None,
 ) -> dict[str, object]:
     tag = clip.display_tag if clip.display_tag is not None else clip.clip.tag
+    title = metadata.title if metadata else None
+    uploader = metadata.uploader if metadata else None
+    webpage_url = metadata.webpage_url if metadata else None
     return {
         "tag": tag,
         "label": clip.clip.label,
@@ -5130,9 +5157,9 @@ def _build_clip_sidecar_payload(
         "end_url": clip.clip.end_url,
         "output_file": output_path.name,
         "output_path": str(output_path),
-        "title": metadata.title if metadata and metadata.title else None,
-        "uploader": metadata.uploader if metadata and metadata.uploader else None,
-        "webpage_url": metadata.webpage_url if metadata and metadata.webpage_url else None,
+        "title": title or None,
+        "uploader": uploader or None,
+        "webpage_url": webpage_url or None,
     }
 
 
@@ -5153,8 +5180,8 @@ def _format_duration(duration: int | None) -> str | None:
     minutes, seconds = divmod(duration, 60)
     hours, minutes = divmod(minutes, 60)
     if hours:
-        return f"{hours:d}:{minutes:02d}:{seconds:02d}"
-    return f"{minutes:d}:{seconds:02d}"
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes}:{seconds:02d}"
 
 
 def _format_tag_label(clip: ResolvedClip) -> str:
@@ -5187,8 +5214,8 @@ def _format_total_duration(total_seconds: float) -> str:
     minutes, seconds = divmod(total, 60)
     hours, minutes = divmod(minutes, 60)
     if hours:
-        return f"{hours:d}:{minutes:02d}:{seconds:02d}"
-    return f"{minutes:d}:{seconds:02d}"
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes}:{seconds:02d}"
 
 
 def _group_title(metadata: VideoMetadata | None) -> str | None:
@@ -5288,7 +5315,9 @@ def _clip_matches_filter(
     return True
 
 
+@functools.lru_cache(maxsize=4096)
 def _thumb_key(clip: ResolvedClip) -> tuple[str, str]:
+    # ResolvedClip is frozen, so the formatted start time never changes.
     return (clip.video_id, format_seconds(clip.start_sec))
 
 
@@ -5320,16 +5349,7 @@ def _apply_pad_updates(
         spec = specs[index]
         new_before = pad_before if pad_before is not None else spec.pad_before
         new_after = pad_after if pad_after is not None else spec.pad_after
-        specs[index] = ClipSpec(
-            start_url=spec.start_url,
-            end_url=spec.end_url,
-            tag=spec.tag,
-            label=spec.label,
-            score=spec.score,
-            opponent=spec.opponent,
-            pad_before=new_before,
-            pad_after=new_after,
-        )
+        specs[index] = replace(spec, pad_before=new_before, pad_after=new_after)
 
 
 def _normalize_pad_overrides(
@@ -5342,40 +5362,52 @@ def _normalize_pad_overrides(
         if spec.pad_before is None or spec.pad_after is None:
             continue
         if spec.pad_before == default_before and spec.pad_after == default_after:
-            specs[index] = ClipSpec(
-                start_url=spec.start_url,
-                end_url=spec.end_url,
-                tag=spec.tag,
-                label=spec.label,
-                score=spec.score,
-                opponent=spec.opponent,
-                pad_before=None,
-                pad_after=None,
-            )
+            specs[index] = replace(spec, pad_before=None, pad_after=None)
             changed = True
     return changed
 
 
+# Hidden Tk root kept alive between clipboard reads; Tk startup costs tens
+# of milliseconds, which is noticeable on every paste action.
+_clipboard_root = None
+
+
+def _destroy_clipboard_root() -> None:
+    global _clipboard_root
+    root = _clipboard_root
+    _clipboard_root = None
+    if root is not None:
+        try:
+            root.destroy()
+        except Exception:
+            pass
+
+
 def _read_system_clipboard() -> str | None:
+    global _clipboard_root
     try:
         import tkinter
     except ImportError:
         return None
-    root = None
-    try:
-        root = tkinter.Tk()
+    root = _clipboard_root
+    if root is None:
+        try:
+            root = tkinter.Tk()
+        except tkinter.TclError:
+            return None
         root.withdraw()
+        _clipboard_root = root
+        atexit.register(_destroy_clipboard_root)
+    try:
         root.update()
-        text = root.clipboard_get()
-        return text
+    except tkinter.TclError:
+        # The root was torn down underneath us; recreate it on the next read.
+        _destroy_clipboard_root()
+        return None
+    try:
+        return root.clipboard_get()
     except tkinter.TclError:
         return None
-    finally:
-        if root is not None:
-            try:
-                root.destroy()
-            except Exception:
-                pass
 
 
 def _render_chafa_output(chafa_path: str | None, path: Path) -> Text | None:
@@ -5383,15 +5415,15 @@ def _render_chafa_output(chafa_path: str | None, path: Path) -> Text | None:
         return None
     command = [chafa_path, "-f", "symbols", "-s", "48x12", str(path)]
     try:
-        completed = subprocess.run(command, check=False, capture_output=True, text=True)
+        completed = subprocess.run(command, check=False, capture_output=True)
     except OSError:
         return None
     if completed.returncode != 0:
         return None
-    output = completed.stdout or ""
-    if not output.strip():
+    raw = completed.stdout or b""
+    if not raw.strip():
         return None
-    return Text.from_ansi(output)
+    return Text.from_ansi(raw.decode("utf-8", "replace"))
 
 
 def _update_image_widget(widget: PreviewImage, path: Path) -> None:
@@ -5408,6 +5440,7 @@ def _update_image_widget(widget: PreviewImage, path: Path) -> None:
     widget.update(str(path))
 
 
+@functools.lru_cache(maxsize=4096)
 def _score_search_path(path: Path, root: Path, query_lower: str) -> int | None:
     rel_text = _relative_display(root, path).lower()
     name_lower = path.name.lower()
@@ -5430,6 +5463,7 @@ def _relative_display(root: Path, path: Path) -> str:
     return str(relative) if str(relative) else "."
 
 
+@functools.lru_cache(maxsize=8192)
 def _path_key(path: Path) -> str:
     try:
         resolved = path.resolve(strict=False)
@@ -5438,15 +5472,21 @@ def _path_key(path: Path) -> str:
     return str(resolved).casefold()
 
 
+@functools.lru_cache(maxsize=256)
+def _fuzzy_query_pattern(query: str) -> re.Pattern[str]:
+    return re.compile(".*?".join(f"({re.escape(char)})" for char in query), re.DOTALL)
+
+
 def _fuzzy_score(candidate: str, query: str) -> int | None:
     if not query:
         return None
+    match = _fuzzy_query_pattern(query).search(candidate)
+    if match is None:
+        return None
     pos = -1
     score = 0
-    for char in query:
-        idx = candidate.find(char, pos + 1)
-        if idx < 0:
-            return None
+    for group in range(1, len(query) + 1):
+        idx = match.start(group)
         score += idx
         if idx == pos + 1:
             score -= 5
@@ -5460,9 +5500,15 @@ def _format_output_name(base: str, output_format: str) -> str:
     return f"{base}.{ext}"
 
 
+_IS_WINDOWS = sys.platform == "win32"
+
+
 def _entry_is_hidden(entry: os.DirEntry) -> bool:
     if entry.name.startswith("."):
         return True
+    if not _IS_WINDOWS:
+        # st_file_attributes only exists on Windows; skip the stat call.
+        return False
     try:
         attrs = entry.stat(follow_symlinks=False).st_file_attributes
         hidden_flag = getattr(stat, "FILE_ATTRIBUTE_HIDDEN", 0)
@@ -5471,18 +5517,22 @@ def _entry_is_hidden(entry: os.DirEntry) -> bool:
         return False
 
 
-def _format_entry_line(
-    root: Path,
-    entry: PathEntry,
-    depth: int = 0,
-    expanded: bool = False,
-) -> str:
-    text = entry.path.name
-    kind = FileEntryKind.DIR if entry.is_dir else FileEntryKind.FILE
-    icon = file_icon_for_kind(kind, entry.path, expanded=expanded if entry.is_dir else None)
-    suffix = "/" if entry.is_dir else ""
-    indent = "  " * max(0, depth)
-    return f"{indent}{icon} {text}{suffix}"
+def _format_entry_lines(entries: list[tuple[PathEntry, int, bool]]) -> list[str]:
+    # Directory icons do not depend on the path, so resolve them once instead
+    # of dispatching through file_icon_for_kind per entry; file icons still
+    # vary by suffix.
+    closed_icon = file_icon_for_kind(FileEntryKind.DIR, Path("."), expanded=False)
+    open_icon = file_icon_for_kind(FileEntryKind.DIR, Path("."), expanded=True)
+    lines: list[str] = []
+    for entry, depth, expanded in entries:
+        indent = "  " * max(0, depth)
+        if entry.is_dir:
+            icon = open_icon if expanded else closed_icon
+            lines.append(f"{indent}{icon} {entry.path.name}/")
+        else:
+            icon = file_icon_for_kind(FileEntryKind.FILE, entry.path)
+            lines.append(f"{indent}{icon} {entry.path.name}")
+    return lines
 
 
 def _format_drive_line(drive: Path) -> str:
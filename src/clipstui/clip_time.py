@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import re
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
@@ -11,22 +12,28 @@ from .timeparse import (
 )
 
 _URL_RE = re.compile(r"https?://[^\s]+")
+_YOUTUBE_HINT_RE = re.compile(r"youtu", re.IGNORECASE)
 
 
 def looks_like_url(value: str) -> bool:
     value = value.strip()
     if "://" in value:
         return True
-    return "youtu" in value.lower()
+    return _YOUTUBE_HINT_RE.search(value) is not None
 
 
 def extract_youtube_urls(text: str) -> list[str]:
+    return list(_extract_youtube_urls_cached(text))
+
+
+@functools.lru_cache(maxsize=64)
+def _extract_youtube_urls_cached(text: str) -> tuple[str, ...]:
     urls: list[str] = []
     for match in _URL_RE.findall(text):
         cleaned = match.strip("()[]{}<>\"'.,")
         if "youtu" in cleaned.lower():
             urls.append(cleaned)
-    return urls
+    return tuple(urls)
 
 
 def coerce_time_input(
@@ -57,7 +64,13 @@ def coerce_time_input(
     return (replace_url_time(base_url, seconds), seconds)
 
 
+_SIMPLE_PARAM_RE = re.compile(r"[A-Za-z0-9_.~-]+")
+
+
 def replace_url_time(url: str, seconds: float) -> str:
+    fast = _replace_url_time_fast(url, seconds)
+    if fast is not None:
+        return fast
     parsed = urlparse(url)
     query = parse_qs(parsed.query)
     key = "t" if "t" in query or "start" not in query else "start"
@@ -66,3 +79,30 @@ def replace_url_time(url: str, seconds: float) -> str:
     query[key] = [format_seconds(seconds)]
     cleaned = urlencode(query, doseq=True)
     return urlunparse(parsed._replace(query=cleaned, fragment=""))
+
+
+def _replace_url_time_fast(url: str, seconds: float) -> str | None:
+    """Rebuild a typical YouTube URL with plain string operations.
+
+    Returns None for anything unusual (fragments, escaped or blank
+    params, repeated keys) so replace_url_time falls back to the full
+    urllib round trip.
+    """
+    if "#" in url:
+        return None
+    base, sep, query = url.partition("?")
+    params: list[tuple[str, str]] = []
+    seen: set[str] = set()
+    if sep:
+        for part in query.split("&"):
+            key, eq, value = part.partition("=")
+            if not eq or key in seen:
+                return None
+            if not (_SIMPLE_PARAM_RE.fullmatch(key) and _SIMPLE_PARAM_RE.fullmatch(value)):
+                return None
+            seen.add(key)
+            params.append((key, value))
+    time_key = "t" if "t" in seen or "start" not in seen else "start"
+    rebuilt = [(key, value) for key, value in params if key != "t" and key != "start"]
+    rebuilt.append((time_key, format_seconds(seconds)))
+    return base + "?" + "&".join(f"{key}={value}" for key, value in rebuilt)
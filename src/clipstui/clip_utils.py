@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from collections import defaultdict, deque
 from dataclasses import dataclass
 from enum import Enum
+from operator import attrgetter
 
 from .parser import ClipSpec
 from .resolve import ResolvedClip, extract_video_id, resolve_clip
@@ -69,9 +71,8 @@ def compute_auto_tags(
 ) -> list[str | None]:
     if options is None:
         return [spec.tag for spec in specs]
-    seen = {spec.tag.casefold() for spec in specs if spec.tag}
-    assigned = set(seen)
-    counters: dict[str, int] = {}
+    assigned = {spec.tag.casefold() for spec in specs if spec.tag}
+    counters: defaultdict[str, int] = defaultdict(int)
     result: list[str | None] = []
 
     for spec in specs:
@@ -84,7 +85,7 @@ def compute_auto_tags(
         else:
             video_id = ""
             counter_key = "__all__"
-        counters[counter_key] = counters.get(counter_key, 0) + 1
+        counters[counter_key] += 1
         tag = _next_auto_tag(
             counters,
             counter_key,
@@ -92,21 +93,37 @@ def compute_auto_tags(
             options,
             video_id,
         )
-        assigned.add(tag.casefold())
         result.append(tag)
 
     return result
 
 
 def group_clips_by_video(clips: list[ResolvedClip]) -> list[ClipGroup]:
+    # Group and accumulate durations in a single pass over the clips.
     groups: dict[str, list[ResolvedClip]] = {}
+    totals: dict[str, float] = {}
     for clip in clips:
-        groups.setdefault(clip.video_id, []).append(clip)
-    result: list[ClipGroup] = []
-    for video_id, items in groups.items():
-        total = sum(_duration(item) for item in items)
-        result.append(ClipGroup(video_id=video_id, clips=items, total_duration=total))
-    return result
+        video_id = clip.video_id
+        groups.setdefault(video_id, []).append(clip)
+        totals[video_id] = totals.get(video_id, 0.0) + max(0.0, clip.end_sec - clip.start_sec)
+    return [
+        ClipGroup(video_id=video_id, clips=items, total_duration=totals[video_id])
+        for video_id, items in groups.items()
+    ]
+
+
+def prepare_sorted_groups(clips: list[ResolvedClip]) -> dict[str, list[ResolvedClip]]:
+    """Group clips by video id with each group sorted by start time.
+
+    Both analyze_overlaps and plan_adjacent_merges accept the result via
+    their ``groups`` parameter so callers running both only group and
+    sort once.
+    """
+    grouped = _group_items(clips)
+    start_key = attrgetter("start_sec")
+    for items in grouped.values():
+        items.sort(key=start_key)
+    return grouped
 
 
 def analyze_overlaps(
@@ -114,17 +131,27 @@ def analyze_overlaps(
     *,
     heavy_overlap_ratio: float = 0.8,
     duplicate_tolerance: float = 0.001,
+    groups: dict[str, list[ResolvedClip]] | None = None,
 ) -> list[OverlapFinding]:
     findings: list[OverlapFinding] = []
-    for video_id, items in _group_items(clips).items():
-        ordered = sorted(items, key=lambda clip: clip.start_sec)
-        for index, first in enumerate(ordered):
-            for second in ordered[index + 1 :]:
-                if second.start_sec > first.end_sec:
-                    break
-                overlap = _overlap_seconds(first, second)
+    if groups is None:
+        groups = prepare_sorted_groups(clips)
+    for video_id, ordered in groups.items():
+        # Sweep over the sorted clips keeping a window of still-active indices;
+        # local start/end lists avoid attribute lookups in the inner loop.
+        starts = [clip.start_sec for clip in ordered]
+        ends = [clip.end_sec for clip in ordered]
+        active: deque[int] = deque()
+        for index, second in enumerate(ordered):
+            start = starts[index]
+            end = ends[index]
+            while active and ends[active[0]] < start:
+                active.popleft()
+            for other in active:
+                overlap = min(ends[other], end) - max(starts[other], start)
                 if overlap <= 0:
                     continue
+                first = ordered[other]
                 if _is_duplicate(first, second, duplicate_tolerance):
                     findings.append(
                         OverlapFinding(
@@ -149,6 +176,7 @@ def analyze_overlaps(
                             kind=OverlapKind.OVERLAP,
                         )
                     )
+            active.append(index)
     return findings
 
 
@@ -156,26 +184,28 @@ def plan_adjacent_merges(
     clips: list[ResolvedClip],
     *,
     gap_threshold: float = 1.0,
+    groups: dict[str, list[ResolvedClip]] | None = None,
 ) -> list[MergeSuggestion]:
     suggestions: list[MergeSuggestion] = []
-    for first, second in zip(clips, clips[1:], strict=False):
-        if first.video_id != second.video_id:
-            continue
-        gap = second.start_sec - first.end_sec
-        if gap > gap_threshold:
-            continue
-        merged_start = min(first.start_sec, second.start_sec)
-        merged_end = max(first.end_sec, second.end_sec)
-        suggestions.append(
-            MergeSuggestion(
-                video_id=first.video_id,
-                first=first,
-                second=second,
-                gap_seconds=gap,
-                merged_start=merged_start,
-                merged_end=merged_end,
+    if groups is None:
+        groups = prepare_sorted_groups(clips)
+    for video_id, ordered in groups.items():
+        for first, second in zip(ordered, ordered[1:], strict=False):
+            gap = second.start_sec - first.end_sec
+            if gap > gap_threshold:
+                continue
+            merged_start = min(first.start_sec, second.start_sec)
+            merged_end = max(first.end_sec, second.end_sec)
+            suggestions.append(
+                MergeSuggestion(
+                    video_id=video_id,
+                    first=first,
+                    second=second,
+                    gap_seconds=gap,
+                    merged_start=merged_start,
+                    merged_end=merged_end,
+                )
             )
-        )
     return suggestions
 
 
@@ -190,30 +220,27 @@ def _group_items(clips: list[ResolvedClip]) -> dict[str, list[ResolvedClip]]:
     return grouped
 
 
-def _overlap_seconds(first: ResolvedClip, second: ResolvedClip) -> float:
-    start = max(first.start_sec, second.start_sec)
-    end = min(first.end_sec, second.end_sec)
-    return max(0.0, end - start)
-
-
 def _is_duplicate(first: ResolvedClip, second: ResolvedClip, tol: float) -> bool:
     return abs(first.start_sec - second.start_sec) <= tol and abs(first.end_sec - second.end_sec) <= tol
 
 
 def _next_auto_tag(
-    counters: dict[str, int],
+    counters: defaultdict[str, int],
     key: str,
     assigned: set[str],
     options: AutoTagOptions,
     video_id: str,
 ) -> str:
+    number = counters[key]
     while True:
-        number = counters.get(key, 1)
         base = f"{options.base_prefix}{number:0{options.width}d}"
         if options.prefix_by_video:
             tag = f"{video_id}{options.prefix_separator}{base}"
         else:
             tag = base
-        if tag.casefold() not in assigned:
+        folded = tag.casefold()
+        if folded not in assigned:
+            assigned.add(folded)
+            counters[key] = number
             return tag
-        counters[key] = number + 1
+        number += 1
@@ -7,6 +7,24 @@ from typing import Any
 
 from .paths import config_path
 
+try:
+    import orjson
+
+    def _loads(raw: bytes) -> Any:
+        return orjson.loads(raw)
+
+    def _dumps(payload: dict[str, Any]) -> bytes:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+
+    def _loads(raw: bytes) -> Any:
+        return json.loads(raw)
+
+    def _dumps(payload: dict[str, Any]) -> bytes:
+        return json.dumps(payload, ensure_ascii=True, indent=2).encode("utf-8")
+
+
 CONFIG_VERSION = 1
 
 
@@ -28,12 +46,12 @@ def load_config(path: Path | None = None) -> tuple[AppConfig, str | None]:
     if not path.exists():
         return AppConfig(), None
     try:
-        raw = path.read_text(encoding="utf-8")
+        raw = path.read_bytes()
     except OSError as exc:
         return AppConfig(), f"Failed to read config: {path} ({exc})"
     try:
-        data = json.loads(raw)
-    except json.JSONDecodeError:
+        data = _loads(raw)
+    except ValueError:
         return AppConfig(), f"Config file is not valid JSON: {path}"
     if not isinstance(data, dict):
         return AppConfig(), f"Config file must be a JSON object: {path}"
@@ -48,10 +66,7 @@ def save_config(config: AppConfig, path: Path | None = None) -> str | None:
         return f"Failed to create config directory: {path.parent} ({exc})"
     payload = _config_to_dict(config)
     try:
-        path.write_text(
-            json.dumps(payload, ensure_ascii=True, indent=2),
-            encoding="utf-8",
-        )
+        path.write_bytes(_dumps(payload))
     except OSError as exc:
         return f"Failed to write config: {path} ({exc})"
     return None
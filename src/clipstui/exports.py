@@ -1,16 +1,28 @@
 from __future__ import annotations
 
-import csv
 import io
 import json
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Mapping
+from typing import Any, TextIO
 
 from .metadata import VideoMetadata
 from .resolve import ResolvedClip, format_output_basename
 from .timeparse import format_seconds
 
+try:
+    import orjson
+
+    def _dumps(payload: dict[str, Any]) -> str:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode("utf-8")
+
+except ImportError:
+
+    def _dumps(payload: dict[str, Any]) -> str:
+        return json.dumps(payload, ensure_ascii=True, indent=2)
+
+
 MANIFEST_FIELDS = [
     "index",
     "tag",
@@ -38,8 +50,10 @@ MANIFEST_FIELDS = [
     "end_url",
 ]
 
+_CSV_HEADER = ",".join(MANIFEST_FIELDS)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ManifestEntry:
     index: int
     tag: str | None
@@ -67,32 +81,39 @@ class ManifestEntry:
     webpage_url: str | None
 
     def to_dict(self) -> dict[str, object]:
-        return {
-            "index": self.index,
-            "tag": self.tag,
-            "label": self.label,
-            "score": self.score,
-            "opponent": self.opponent,
-            "video_id": self.video_id,
-            "start_sec": self.start_sec,
-            "end_sec": self.end_sec,
-            "cut_start": self.cut_start,
-            "cut_end": self.cut_end,
-            "duration": self.duration,
-            "cut_duration": self.cut_duration,
-            "pad_before": self.pad_before,
-            "pad_after": self.pad_after,
-            "output_name": self.output_name,
-            "output_format": self.output_format,
-            "output_file": self.output_file,
-            "output_path": str(self.output_path),
-            "title": self.title,
-            "uploader": self.uploader,
-            "video_duration": self.video_duration,
-            "webpage_url": self.webpage_url,
-            "start_url": self.start_url,
-            "end_url": self.end_url,
-        }
+        # Values follow MANIFEST_FIELDS order, the same column schema the
+        # CSV writer uses; dict(zip(...)) builds the mapping in one C call.
+        return dict(
+            zip(
+                MANIFEST_FIELDS,
+                (
+                    self.index,
+                    self.tag,
+                    self.label,
+                    self.score,
+                    self.opponent,
+                    self.video_id,
+                    self.start_sec,
+                    self.end_sec,
+                    self.cut_start,
+                    self.cut_end,
+                    self.duration,
+                    self.cut_duration,
+                    self.pad_before,
+                    self.pad_after,
+                    self.output_name,
+                    self.output_format,
+                    self.output_file,
+                    str(self.output_path),
+                    self.title,
+                    self.uploader,
+                    self.video_duration,
+                    self.webpage_url,
+                    self.start_url,
+                    self.end_url,
+                ),
+            )
+        )
 
 
 def build_manifest_entries(
@@ -105,28 +126,34 @@ def build_manifest_entries(
 ) -> list[ManifestEntry]:
     entries: list[ManifestEntry] = []
     output_format = output_format.lower().lstrip(".")
+    # Hoisted lookups for the per-clip loop; manifests can span thousands
+    # of clips and the rounding math dominates otherwise.
+    rnd = round
+    get_meta = metadata.get if metadata is not None else None
+    dot_format = "." + output_format
     for index, clip in enumerate(clips, start=1):
-        meta = metadata.get(clip.video_id) if metadata else None
+        spec = clip.clip
+        meta = get_meta(clip.video_id) if get_meta else None
         title = meta.title if meta and meta.title else None
         output_name = _output_basename(output_template, clip, title)
-        output_file = f"{output_name}.{output_format}"
+        output_file = output_name + dot_format
         output_path = output_dir / output_file
-        start_sec = _round_seconds(clip.start_sec)
-        end_sec = _round_seconds(clip.end_sec)
-        cut_start = _round_seconds(clip.cut_start)
-        cut_end = _round_seconds(clip.cut_end)
-        duration = _round_seconds(max(0.0, end_sec - start_sec))
-        cut_duration = _round_seconds(max(0.0, cut_end - cut_start))
-        pad_before = _round_seconds(max(0.0, start_sec - cut_start))
-        pad_after = _round_seconds(max(0.0, cut_end - end_sec))
-        tag = clip.display_tag if clip.display_tag is not None else clip.clip.tag
+        start_sec = rnd(clip.start_sec, 3)
+        end_sec = rnd(clip.end_sec, 3)
+        cut_start = rnd(clip.cut_start, 3)
+        cut_end = rnd(clip.cut_end, 3)
+        duration = rnd(max(0.0, end_sec - start_sec), 3)
+        cut_duration = rnd(max(0.0, cut_end - cut_start), 3)
+        pad_before = rnd(max(0.0, start_sec - cut_start), 3)
+        pad_after = rnd(max(0.0, cut_end - end_sec), 3)
+        tag = clip.display_tag if clip.display_tag is not None else spec.tag
         entries.append(
             ManifestEntry(
                 index=index,
                 tag=tag,
-                label=clip.clip.label,
-                score=clip.clip.score,
-                opponent=clip.clip.opponent,
+                label=spec.label,
+                score=spec.score,
+                opponent=spec.opponent,
                 video_id=clip.video_id,
                 start_sec=start_sec,
                 end_sec=end_sec,
@@ -140,8 +167,8 @@ def build_manifest_entries(
                 output_format=output_format,
                 output_file=output_file,
                 output_path=output_path,
-                start_url=clip.clip.start_url,
-                end_url=clip.clip.end_url,
+                start_url=spec.start_url,
+                end_url=spec.end_url,
                 title=title,
                 uploader=meta.uploader if meta and meta.uploader else None,
                 video_duration=meta.duration if meta else None,
@@ -152,14 +179,25 @@ def build_manifest_entries(
 
 
 def manifest_to_csv(entries: Iterable[ManifestEntry]) -> str:
-    buffer = io.StringIO(newline="")
-    writer = csv.DictWriter(buffer, fieldnames=MANIFEST_FIELDS)
-    writer.writeheader()
-    for entry in entries:
-        writer.writerow(_entry_csv_row(entry))
+    buffer = io.StringIO()
+    manifest_write_csv(entries, buffer)
     return buffer.getvalue()
 
 
+def manifest_write_csv(entries: Iterable[ManifestEntry], fp: TextIO) -> None:
+    """Stream the manifest CSV to ``fp`` without building it in memory.
+
+    The schema is fixed, so rows are emitted directly instead of going
+    through csv.DictWriter; _csv_field applies the same minimal quoting.
+    Open file targets with ``newline=""`` so the CRLF terminators pass
+    through untranslated.
+    """
+    write = fp.write
+    write(_CSV_HEADER + "\r\n")
+    for entry in entries:
+        write(",".join(_entry_csv_row(entry)) + "\r\n")
+
+
 def manifest_to_json(
     entries: Iterable[ManifestEntry],
     *,
@@ -175,46 +213,62 @@ def manifest_to_json(
         "output_template": output_template,
         "clips": [entry.to_dict() for entry in entries_list],
     }
-    return json.dumps(payload, ensure_ascii=True, indent=2)
+    return _dumps(payload)
 
 
 def build_concat_list(paths: Iterable[Path]) -> str:
-    lines = [
-        "# clipstui concat list",
-        "# ffmpeg -f concat -safe 0 -i concat.txt -c copy output.mp4",
+    return "\n".join(
+        [
+            "# clipstui concat list",
+            "# ffmpeg -f concat -safe 0 -i concat.txt -c copy output.mp4",
+            *(f"file {_concat_quote(path)}" for path in paths),
+            "",
+        ]
+    )
+
+
+def _entry_csv_row(entry: ManifestEntry) -> list[str]:
+    # Field order mirrors MANIFEST_FIELDS. format_seconds output is always
+    # plain digits, so only the string fields go through _csv_field; it is
+    # also memoized, so recurring values (0.0 pads, shared cut points)
+    # format once across the whole manifest.
+    quote = _csv_field
+    fmt = format_seconds
+    return [
+        str(entry.index),
+        quote(entry.tag or ""),
+        quote(entry.label or ""),
+        quote(entry.score or ""),
+        quote(entry.opponent or ""),
+        quote(entry.video_id),
+        fmt(entry.start_sec),
+        fmt(entry.end_sec),
+        fmt(entry.cut_start),
+        fmt(entry.cut_end),
+        fmt(entry.duration),
+        fmt(entry.cut_duration),
+        fmt(entry.pad_before),
+        fmt(entry.pad_after),
+        quote(entry.output_name),
+        quote(entry.output_format),
+        quote(entry.output_file),
+        quote(str(entry.output_path)),
+        quote(entry.title or ""),
+        quote(entry.uploader or ""),
+        str(entry.video_duration) if entry.video_duration is not None else "",
+        quote(entry.webpage_url or ""),
+        quote(entry.start_url),
+        quote(entry.end_url),
     ]
-    for path in paths:
-        lines.append(f"file {_concat_quote(path)}")
-    return "\n".join(lines) + "\n"
-
-
-def _entry_csv_row(entry: ManifestEntry) -> dict[str, str]:
-    return {
-        "index": str(entry.index),
-        "tag": entry.tag or "",
-        "label": entry.label or "",
-        "score": entry.score or "",
-        "opponent": entry.opponent or "",
-        "video_id": entry.video_id,
-        "start_sec": format_seconds(entry.start_sec),
-        "end_sec": format_seconds(entry.end_sec),
-        "cut_start": format_seconds(entry.cut_start),
-        "cut_end": format_seconds(entry.cut_end),
-        "duration": format_seconds(entry.duration),
-        "cut_duration": format_seconds(entry.cut_duration),
-        "pad_before": format_seconds(entry.pad_before),
-        "pad_after": format_seconds(entry.pad_after),
-        "output_name": entry.output_name,
-        "output_format": entry.output_format,
-        "output_file": entry.output_file,
-        "output_path": str(entry.output_path),
-        "title": entry.title or "",
-        "uploader": entry.uploader or "",
-        "video_duration": str(entry.video_duration) if entry.video_duration is not None else "",
-        "webpage_url": entry.webpage_url or "",
-        "start_url": entry.start_url,
-        "end_url": entry.end_url,
-    }
+
+
+def _csv_field(value: str) -> str:
+    if '"' in value:
+        escaped = value.replace('"', '""')
+        return f'"{escaped}"'
+    if "," in value or "\n" in value or "\r" in value:
+        return f'"{value}"'
+    return value
 
 
 def _output_basename(template: str, clip: ResolvedClip, title: str | None) -> str:
@@ -224,11 +278,8 @@ def _output_basename(template: str, clip: ResolvedClip, title: str | None) -> st
         return clip.output_name
 
 
-def _round_seconds(value: float) -> float:
-    return round(value, 3)
+_CONCAT_TRANS = str.maketrans({"'": "\\'"})
 
 
 def _concat_quote(path: Path) -> str:
-    text = path.as_posix()
-    text = text.replace("'", "\\'")
-    return f"'{text}'"
+    return f"'{path.as_posix().translate(_CONCAT_TRANS)}'"
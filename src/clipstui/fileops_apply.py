@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import functools
 import os
 import shutil
+from collections import Counter, deque
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
@@ -26,24 +28,29 @@ class ApplyResult:
 class ApplyReport:
     results: list[ApplyResult]
 
+    @functools.cached_property
+    def _status_counts(self) -> Counter[ApplyStatus]:
+        # Callers typically read all three counts; tally them in one pass.
+        return Counter(result.status for result in self.results)
+
     @property
     def ok_count(self) -> int:
-        return sum(1 for result in self.results if result.status == ApplyStatus.OK)
+        return self._status_counts[ApplyStatus.OK]
 
     @property
     def error_count(self) -> int:
-        return sum(1 for result in self.results if result.status == ApplyStatus.ERROR)
+        return self._status_counts[ApplyStatus.ERROR]
 
     @property
     def skipped_count(self) -> int:
-        return sum(1 for result in self.results if result.status == ApplyStatus.SKIPPED)
+        return self._status_counts[ApplyStatus.SKIPPED]
 
 
 @dataclass(frozen=True)
 class _MoveStep:
     source: Path
     target: Path
-    origin: Operation
+    origin: int
     is_dir: bool
 
 
@@ -51,7 +58,7 @@ class _MoveStep:
 class _MoveItem:
     source: Path
     target: Path
-    origin: Operation
+    origin: int
     is_dir: bool
 
 
@@ -119,26 +126,23 @@ def _apply_delete(op: Operation) -> ApplyResult:
 
 
 def _apply_moves(moves: list[Operation]) -> list[ApplyResult]:
-    results: list[ApplyResult] = []
-    move_steps, skipped = _order_moves(moves)
-    results.extend(skipped)
-
-    skipped_ids = {id(result.operation) for result in skipped}
-    status_by_id: dict[int, ApplyResult] = {
-        id(op): ApplyResult(op, ApplyStatus.OK, None) for op in moves if id(op) not in skipped_ids
-    }
+    # Statuses live in a list parallel to `moves`; steps reference their
+    # originating move by index, so the hot loop is plain list indexing.
+    move_steps, statuses = _order_moves(moves)
+    for idx, op in enumerate(moves):
+        if statuses[idx] is None:
+            statuses[idx] = ApplyResult(op, ApplyStatus.OK, None)
 
     for step in move_steps:
-        current = status_by_id.get(id(step.origin))
+        current = statuses[step.origin]
         if current is None or current.status == ApplyStatus.ERROR:
             continue
         try:
             _apply_move_step(step.source, step.target, step.is_dir)
         except OSError as exc:
-            status_by_id[id(step.origin)] = ApplyResult(step.origin, ApplyStatus.ERROR, str(exc))
+            statuses[step.origin] = ApplyResult(moves[step.origin], ApplyStatus.ERROR, str(exc))
 
-    results.extend(status_by_id.values())
-    return results
+    return [status for status in statuses if status is not None]
 
 
 def _apply_move_step(source: Path, target: Path, is_dir: bool) -> None:
@@ -157,41 +161,82 @@ def _apply_move_step(source: Path, target: Path, is_dir: bool) -> None:
         shutil.move(str(source), str(target))
 
 
-def _order_moves(moves: list[Operation]) -> tuple[list[_MoveStep], list[ApplyResult]]:
-    pending: list[_MoveItem] = []
-    skipped: list[ApplyResult] = []
-    for op in moves:
+def _order_moves(moves: list[Operation]) -> tuple[list[_MoveStep], list[ApplyResult | None]]:
+    items: list[_MoveItem] = []
+    statuses: list[ApplyResult | None] = [None] * len(moves)
+    for move_idx, op in enumerate(moves):
         if op.source is None or op.target is None:
-            skipped.append(ApplyResult(op, ApplyStatus.ERROR, "Missing source or target."))
+            statuses[move_idx] = ApplyResult(op, ApplyStatus.ERROR, "Missing source or target.")
             continue
         if _path_key(op.source) == _path_key(op.target):
-            skipped.append(ApplyResult(op, ApplyStatus.SKIPPED, "Source and target are the same."))
+            statuses[move_idx] = ApplyResult(
+                op, ApplyStatus.SKIPPED, "Source and target are the same."
+            )
             continue
-        pending.append(_MoveItem(op.source, op.target, op, op.is_dir))
+        items.append(_MoveItem(op.source, op.target, move_idx, op.is_dir))
 
+    # Kahn-style ordering: a move is blocked while another pending move still
+    # occupies its target path. Emitting a move frees its source key, which
+    # readies any moves waiting on it; when only cycles remain, the first
+    # still-pending move is redirected through a temp path to break the loop.
     steps: list[_MoveStep] = []
-    source_keys = {_path_key(item.source) for item in pending}
-    existing_keys = source_keys | {_path_key(item.target) for item in pending}
-
-    while pending:
-        progress = False
-        for item in list(pending):
-            if _path_key(item.target) not in source_keys:
-                steps.append(_MoveStep(item.source, item.target, item.origin, item.is_dir))
-                pending.remove(item)
-                source_keys.discard(_path_key(item.source))
-                progress = True
-        if progress:
-            continue
-        item = pending.pop(0)
-        source_keys.discard(_path_key(item.source))
+    by_source: dict[str, int] = {_path_key(item.source): idx for idx, item in enumerate(items)}
+    existing_keys = set(by_source) | {_path_key(item.target) for item in items}
+    waiting: dict[str, list[int]] = {}
+    ready: deque[int] = deque()
+    done = [False] * len(items)
+
+    for idx, item in enumerate(items):
+        target_key = _path_key(item.target)
+        if target_key in by_source:
+            waiting.setdefault(target_key, []).append(idx)
+        else:
+            ready.append(idx)
+
+    emitted = 0
+    total = len(items)
+    cursor = 0
+    while emitted < total:
+        while ready:
+            idx = ready.popleft()
+            if done[idx]:
+                continue
+            item = items[idx]
+            steps.append(_MoveStep(item.source, item.target, item.origin, item.is_dir))
+            done[idx] = True
+            emitted += 1
+            source_key = _path_key(item.source)
+            if by_source.get(source_key) == idx:
+                del by_source[source_key]
+            ready.extend(waiting.pop(source_key, ()))
+        if emitted >= total:
+            break
+        while done[cursor]:
+            cursor += 1
+        item = items[cursor]
+        source_key = _path_key(item.source)
+        del by_source[source_key]
         temp = _unique_temp_path(item.source, existing_keys)
-        existing_keys.add(_path_key(temp))
+        temp_key = _path_key(temp)
+        existing_keys.add(temp_key)
         steps.append(_MoveStep(item.source, temp, item.origin, item.is_dir))
-        pending.append(_MoveItem(temp, item.target, item.origin, item.is_dir))
-        source_keys.add(_path_key(temp))
+        done[cursor] = True
+        emitted += 1
+        ready.extend(waiting.pop(source_key, ()))
+
+        second_leg = _MoveItem(temp, item.target, item.origin, item.is_dir)
+        items.append(second_leg)
+        done.append(False)
+        total += 1
+        leg_idx = len(items) - 1
+        by_source[temp_key] = leg_idx
+        target_key = _path_key(second_leg.target)
+        if target_key in by_source:
+            waiting.setdefault(target_key, []).append(leg_idx)
+        else:
+            ready.append(leg_idx)
 
-    return steps, skipped
+    return steps, statuses
 
 
 def _unique_temp_path(source: Path, existing: set[str]) -> Path:
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+import functools
+import os
+import re
 from dataclasses import dataclass
-from difflib import SequenceMatcher
 from enum import Enum
 from pathlib import Path
 
 DELETE_MARKER = "[DELETE]"
+_DELETE_MARKER_LEN = len(DELETE_MARKER)
 
-_INVALID_CHARS = set('<>:"/\\|?*')
+_INVALID_CHARS_RE = re.compile(r'[\x00-\x1f<>:"/\\|?*]')
 _RESERVED_NAMES = {
     "CON",
     "PRN",
@@ -84,8 +87,10 @@ def compute_plan(
     edited_lines: list[str],
 ) -> OperationPlan:
     root_resolved = root.resolve()
+    resolved: dict[Path, Path] = {}
     original_norms = [
-        _normalize_rel(_rel_to_root(root_resolved, entry.path)) for entry in original_entries
+        _normalize_rel(_rel_to_root(root_resolved, entry.path, resolved))
+        for entry in original_entries
     ]
     parse_errors: list[ValidationError] = []
     edited_entries: list[EditedEntry] = []
@@ -96,46 +101,67 @@ def compute_plan(
         if not stripped:
             continue
         if _is_delete_marker(stripped):
-            marker = _parse_delete_marker(root_resolved, stripped, parse_errors)
+            marker = _parse_delete_marker(root_resolved, stripped, parse_errors, resolved)
             if marker is not None:
                 delete_markers.append(marker)
             continue
-        entry = _parse_edited_entry(root_resolved, raw, parse_errors)
+        entry = _parse_edited_entry(root_resolved, raw, parse_errors, resolved)
         if entry is not None:
             edited_entries.append(entry)
 
     edited_norms = [entry.norm for entry in edited_entries]
-    matcher = SequenceMatcher(a=original_norms, b=edited_norms, autojunk=False)
+
+    # Common case: the buffer came back unchanged and nothing is marked for
+    # deletion, so skip the diff bookkeeping entirely.
+    if edited_norms == original_norms and not delete_markers:
+        return OperationPlan(
+            root=root_resolved,
+            operations=[],
+            original_entries=original_entries,
+            edited_entries=edited_entries,
+            delete_markers=delete_markers,
+            parse_errors=parse_errors,
+        )
 
     state = ["keep"] * len(original_entries)
     move_target: list[int | None] = [None] * len(original_entries)
     create_indices: list[int] = []
 
-    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
-        if tag == "equal":
-            continue
-        if tag == "delete":
-            for idx in range(i1, i2):
-                state[idx] = "delete"
-            continue
-        if tag == "insert":
-            create_indices.extend(range(j1, j2))
-            continue
-        if tag == "replace":
-            orig_block = list(range(i1, i2))
-            edit_block = list(range(j1, j2))
-            pair_count = min(len(orig_block), len(edit_block))
+    # Hash-based diff: entries present in both lists anchor a two-pointer
+    # walk, and moves are paired positionally only inside a removed/added
+    # run sitting between the same two anchors — the pairing
+    # SequenceMatcher's replace blocks produced, without its quadratic
+    # matching. A removed line whose replacement appears in a different
+    # region stays a delete instead of being misread as a move.
+    edited_norm_set = set(edited_norms)
+    original_norm_set = set(original_norms)
+    orig_count = len(original_norms)
+    edit_count = len(edited_norms)
+    i = 0
+    j = 0
+    while i < orig_count or j < edit_count:
+        removed_run: list[int] = []
+        while i < orig_count and original_norms[i] not in edited_norm_set:
+            removed_run.append(i)
+            i += 1
+        added_run: list[int] = []
+        while j < edit_count and edited_norms[j] not in original_norm_set:
+            added_run.append(j)
+            j += 1
+        if removed_run or added_run:
+            pair_count = min(len(removed_run), len(added_run))
             for offset in range(pair_count):
-                orig_idx = orig_block[offset]
-                edit_idx = edit_block[offset]
+                orig_idx = removed_run[offset]
                 state[orig_idx] = "move"
-                move_target[orig_idx] = edit_idx
-            for idx in orig_block[pair_count:]:
-                state[idx] = "delete"
-            create_indices.extend(edit_block[pair_count:])
+                move_target[orig_idx] = added_run[offset]
+            for orig_idx in removed_run[pair_count:]:
+                state[orig_idx] = "delete"
+            create_indices.extend(added_run[pair_count:])
+            continue
+        i += 1
+        j += 1
 
     norm_to_index = {norm: idx for idx, norm in enumerate(original_norms)}
-    edited_norm_set = {entry.norm for entry in edited_entries}
     for marker in delete_markers:
         idx = norm_to_index.get(marker.norm)
         if idx is None:
@@ -209,7 +235,9 @@ def validate_plan(plan: OperationPlan) -> list[ValidationError]:
             )
         else:
             edited_keys[key] = entry.path
-        name_error = _validate_relative_path(root, entry.path)
+        # entry.rel was derived from the resolved path at parse time, so the
+        # components can be checked directly without another resolve pass.
+        name_error = _validate_rel(entry.rel)
         if name_error:
             errors.append(ValidationError(name_error, entry.path))
 
@@ -223,11 +251,16 @@ def validate_plan(plan: OperationPlan) -> list[ValidationError]:
         else:
             target_keys[key] = op
 
-    planned_dirs = _planned_dirs(root, plan.original_entries, plan.operations)
+    resolved: dict[Path, Path] = {}
+    planned_dirs = _planned_dirs(root, plan.original_entries, plan.operations, resolved)
+    # Existence checks share one scandir listing per parent directory, so a
+    # batch of renames inside a folder costs one syscall instead of one stat
+    # per operation.
+    listings: dict[str, dict[str, bool] | None] = {}
     for op in plan.operations:
-        if op.source and not _is_within_root(root, op.source):
+        if op.source and not _is_within_root(root, op.source, resolved):
             errors.append(ValidationError("Source is outside the current root.", op.source))
-        if op.target and not _is_within_root(root, op.target):
+        if op.target and not _is_within_root(root, op.target, resolved):
             errors.append(ValidationError("Target is outside the current root.", op.target))
 
         if op.op_type in {OperationType.MOVE, OperationType.CREATE_FILE, OperationType.CREATE_DIR}:
@@ -235,24 +268,24 @@ def validate_plan(plan: OperationPlan) -> list[ValidationError]:
                 continue
             parent = op.target.parent
             parent_key = _path_key(parent)
-            if parent_key not in planned_dirs and not parent.exists():
+            if parent_key not in planned_dirs and not _cached_exists(listings, parent):
                 errors.append(ValidationError("Target parent does not exist.", op.target))
 
         if op.op_type == OperationType.MOVE and op.source and op.target:
-            if op.is_dir and _is_relative_to(op.target, op.source):
+            if op.is_dir and _is_relative_to(op.target, op.source, resolved):
                 errors.append(ValidationError("Cannot move a directory into itself.", op.target))
-            if op.target.exists():
+            if _cached_exists(listings, op.target):
                 if op.is_dir:
                     errors.append(ValidationError("Target directory already exists.", op.target))
-                elif op.target.is_dir():
+                elif _cached_is_dir(listings, op.target):
                     errors.append(ValidationError("Target is an existing directory.", op.target))
 
         if op.op_type == OperationType.CREATE_FILE and op.target:
-            if op.target.exists():
+            if _cached_exists(listings, op.target):
                 errors.append(ValidationError("Target file already exists.", op.target))
 
         if op.op_type == OperationType.CREATE_DIR and op.target:
-            if op.target.exists() and not op.target.is_dir():
+            if _cached_exists(listings, op.target) and not _cached_is_dir(listings, op.target):
                 errors.append(ValidationError("Target exists and is not a directory.", op.target))
 
     return errors
@@ -260,12 +293,13 @@ def validate_plan(plan: OperationPlan) -> list[ValidationError]:
 
 def collect_confirmations(plan: OperationPlan) -> list[Confirmation]:
     confirmations: list[Confirmation] = []
+    listings: dict[str, dict[str, bool] | None] = {}
     for op in plan.operations:
         if op.op_type == OperationType.DELETE:
             confirmations.append(Confirmation(op, "Confirm delete"))
         elif op.op_type == OperationType.MOVE:
-            if op.target and op.target.exists() and op.source:
-                if not op.is_dir and not op.target.is_dir():
+            if op.target and _cached_exists(listings, op.target) and op.source:
+                if not op.is_dir and not _cached_is_dir(listings, op.target):
                     confirmations.append(Confirmation(op, "Confirm overwrite"))
         elif op.op_type == OperationType.CREATE_DIR:
             continue
@@ -275,7 +309,10 @@ def collect_confirmations(plan: OperationPlan) -> list[Confirmation]:
 
 
 def _parse_edited_entry(
-    root: Path, raw: str, errors: list[ValidationError]
+    root: Path,
+    raw: str,
+    errors: list[ValidationError],
+    resolved: dict[Path, Path],
 ) -> EditedEntry | None:
     text = raw.strip()
     is_dir_hint = text.endswith(("/", "\\"))
@@ -290,7 +327,7 @@ def _parse_edited_entry(
         return None
     if not path.is_absolute():
         path = root / path
-    path = path.resolve(strict=False)
+    path = _resolve_lenient(resolved, path)
     try:
         rel = path.relative_to(root)
     except ValueError:
@@ -304,65 +341,121 @@ def _parse_edited_entry(
 
 
 def _parse_delete_marker(
-    root: Path, raw: str, errors: list[ValidationError]
+    root: Path,
+    raw: str,
+    errors: list[ValidationError],
+    resolved: dict[Path, Path],
 ) -> DeleteMarker | None:
     remainder = raw[len(DELETE_MARKER) :].strip()
     if not remainder:
         errors.append(ValidationError("Delete marker missing a path.", None))
         return None
-    entry = _parse_edited_entry(root, remainder, errors)
+    entry = _parse_edited_entry(root, remainder, errors, resolved)
     if entry is None:
         return None
     return DeleteMarker(raw=raw, path=entry.path, rel=entry.rel, norm=entry.norm)
 
 
 def _is_delete_marker(value: str) -> bool:
-    return value.upper().startswith(DELETE_MARKER)
+    # Uppercase only the prefix instead of copying the whole line.
+    return value[:_DELETE_MARKER_LEN].upper() == DELETE_MARKER
 
 
 def _normalize_rel(rel: Path) -> str:
     return rel.as_posix().rstrip("/")
 
 
-def _rel_to_root(root: Path, path: Path) -> Path:
+def _rel_to_root(root: Path, path: Path, resolved: dict[Path, Path]) -> Path:
     if not path.is_absolute():
         path = root / path
-    resolved = path.resolve(strict=False)
+    resolved_path = _resolve_lenient(resolved, path)
     try:
-        return resolved.relative_to(root)
+        return resolved_path.relative_to(root)
     except ValueError:
-        return Path(resolved.name)
+        return Path(resolved_path.name)
 
 
+@functools.lru_cache(maxsize=4096)
 def _path_key(path: Path) -> str:
     return str(path).casefold()
 
 
-def _is_within_root(root: Path, path: Path) -> bool:
+def _resolve_lenient(resolved: dict[Path, Path], path: Path) -> Path:
+    # Scoped per plan pass like the scandir listings: symlink resolution
+    # must not outlive the filesystem state the plan is judged against.
+    cached = resolved.get(path)
+    if cached is None:
+        cached = path.resolve(strict=False)
+        resolved[path] = cached
+    return cached
+
+
+# On Windows the filesystem matches names case-insensitively, so listing
+# lookups must casefold to agree with what Path.exists() would report.
+_CASEFOLD_NAMES = os.name == "nt"
+
+
+def _listing_name(name: str) -> str:
+    return name.casefold() if _CASEFOLD_NAMES else name
+
+
+def _parent_listing(
+    listings: dict[str, dict[str, bool] | None], parent: Path
+) -> dict[str, bool] | None:
+    key = _path_key(parent)
+    if key not in listings:
+        try:
+            with os.scandir(parent) as it:
+                listings[key] = {_listing_name(entry.name): entry.is_dir() for entry in it}
+        except OSError:
+            listings[key] = None
+    return listings[key]
+
+
+def _cached_exists(listings: dict[str, dict[str, bool] | None], path: Path) -> bool:
+    listing = _parent_listing(listings, path.parent)
+    if listing is None:
+        return path.exists()
+    return _listing_name(path.name) in listing
+
+
+def _cached_is_dir(listings: dict[str, dict[str, bool] | None], path: Path) -> bool:
+    listing = _parent_listing(listings, path.parent)
+    if listing is None:
+        return path.is_dir()
+    return listing.get(_listing_name(path.name), False)
+
+
+def _is_within_root(root: Path, path: Path, resolved: dict[Path, Path]) -> bool:
     try:
-        path.resolve(strict=False).relative_to(root)
+        _resolve_lenient(resolved, path).relative_to(root)
     except ValueError:
         return False
     return True
 
 
-def _is_relative_to(path: Path, base: Path) -> bool:
+def _is_relative_to(path: Path, base: Path, resolved: dict[Path, Path]) -> bool:
     try:
-        path.resolve(strict=False).relative_to(base.resolve(strict=False))
+        _resolve_lenient(resolved, path).relative_to(_resolve_lenient(resolved, base))
     except ValueError:
         return False
     return True
 
 
-def _planned_dirs(root: Path, original: list[PathEntry], operations: list[Operation]) -> set[str]:
+def _planned_dirs(
+    root: Path,
+    original: list[PathEntry],
+    operations: list[Operation],
+    resolved: dict[Path, Path],
+) -> set[str]:
     dirs: set[str] = {_path_key(root)}
     for entry in original:
         if entry.is_dir:
-            dirs.add(_path_key(entry.path.resolve(strict=False)))
+            dirs.add(_path_key(_resolve_lenient(resolved, entry.path)))
     for op in operations:
         if op.op_type != OperationType.CREATE_DIR or op.target is None:
             continue
-        current = op.target.resolve(strict=False)
+        current = _resolve_lenient(resolved, op.target)
         while True:
             dirs.add(_path_key(current))
             if current == root or current.parent == current:
@@ -371,11 +464,7 @@ def _planned_dirs(root: Path, original: list[PathEntry], operations: list[Operat
     return dirs
 
 
-def _validate_relative_path(root: Path, path: Path) -> str | None:
-    try:
-        rel = path.resolve(strict=False).relative_to(root)
-    except ValueError:
-        return "Path escapes the current root."
+def _validate_rel(rel: Path) -> str | None:
     if not rel.parts:
         return "Path resolves to the root directory."
     for part in rel.parts:
@@ -390,9 +479,8 @@ def _invalid_component(part: str) -> str | None:
         return "Path component is invalid."
     if part[-1] in {" ", "."}:
         return "Path component ends with a space or dot."
-    for char in part:
-        if char in _INVALID_CHARS or ord(char) < 32:
-            return "Path component contains invalid characters."
+    if _INVALID_CHARS_RE.search(part):
+        return "Path component contains invalid characters."
     trimmed = part.rstrip(" .")
     if not trimmed:
         return "Path component is invalid."
@@ -403,7 +491,7 @@ def _invalid_component(part: str) -> str | None:
 
 
 def is_delete_marker_line(line: str) -> bool:
-    return line.strip().upper().startswith(DELETE_MARKER)
+    return _is_delete_marker(line.strip())
 
 
 def strip_delete_marker(line: str) -> str:
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import subprocess
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable
@@ -9,6 +10,24 @@ from typing import Any, Callable
 from .paths import metadata_cache_dir
 from .resolve import extract_video_id
 
+try:
+    import orjson
+
+    def _json_loads(raw: bytes | str) -> Any:
+        return orjson.loads(raw)
+
+    def _json_dumps(data: dict[str, Any]) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+
+    def _json_loads(raw: bytes | str) -> Any:
+        return json.loads(raw)
+
+    def _json_dumps(data: dict[str, Any]) -> bytes:
+        return json.dumps(data, ensure_ascii=True, indent=2).encode("utf-8")
+
+
 Runner = Callable[[list[str]], subprocess.CompletedProcess[str]]
 
 
@@ -27,16 +46,60 @@ def get_metadata(
     cache_dir: Path | None = None,
     runner: Runner | None = None,
 ) -> VideoMetadata:
+    metadata, _ = get_metadata_bundle(url, cache_dir=cache_dir, runner=runner)
+    return metadata
+
+
+def get_metadata_bundle(
+    url: str,
+    cache_dir: Path | None = None,
+    runner: Runner | None = None,
+) -> tuple[VideoMetadata, str | None]:
+    """Fetch metadata plus, when yt-dlp actually runs, the direct media URL.
+
+    yt-dlp startup dominates the cost of either output alone, so the
+    direct URL is read from the same dump-json payload instead of a
+    second ``-g`` invocation. Cache hits return None for the URL: direct
+    URLs expire quickly, so only a freshly fetched one is worth handing
+    to the thumbnail pipeline.
+    """
     video_id = extract_video_id(url)
     cache_dir = cache_dir or metadata_cache_dir()
     cache_path = cache_dir / f"{video_id}.json"
+    cache_key = str(cache_path)
+
+    cached = _memory_cache.get(cache_key)
+    if cached is not None:
+        return cached, None
 
     data = _read_cached_json(cache_path)
-    if data is None:
-        data = _run_dump_json(url, runner)
-        _write_json(cache_path, data)
+    if data is not None:
+        metadata = _parse_metadata(data, video_id)
+        _remember(cache_key, metadata)
+        return metadata, None
+
+    data = _run_dump_json(url, runner)
+    _write_json(cache_path, _trim_metadata(data))
+    metadata = _parse_metadata(data, video_id)
+    _remember(cache_key, metadata)
+    return metadata, _direct_url_from_data(data)
+
+
+# Finished VideoMetadata instances keyed by cache file path, so warm
+# lookups skip the disk read, JSON parse and dataclass construction.
+# Keying by path keeps callers with distinct cache dirs isolated.
+_memory_cache: dict[str, VideoMetadata] = {}
+_memory_cache_lock = threading.Lock()
+_MEMORY_CACHE_LIMIT = 512
 
-    return _parse_metadata(data, video_id)
+
+def _remember(cache_key: str, metadata: VideoMetadata) -> None:
+    # The metadata workers call this concurrently; the lock keeps one
+    # thread's eviction from popping a key another thread just removed.
+    with _memory_cache_lock:
+        if len(_memory_cache) >= _MEMORY_CACHE_LIMIT:
+            _memory_cache.pop(next(iter(_memory_cache)), None)
+        _memory_cache[cache_key] = metadata
 
 
 def _run_dump_json(url: str, runner: Runner | None) -> dict[str, Any]:
@@ -53,8 +116,8 @@ def _run_dump_json(url: str, runner: Runner | None) -> dict[str, Any]:
         raise RuntimeError("yt-dlp returned no metadata")
 
     try:
-        return json.loads(line)
-    except json.JSONDecodeError as exc:
+        return _json_loads(line)
+    except ValueError as exc:
         raise RuntimeError("Failed to parse metadata JSON") from exc
 
 
@@ -79,17 +142,38 @@ def _last_non_empty_line(text: str) -> str | None:
 
 
 def _read_cached_json(path: Path) -> dict[str, Any] | None:
-    if not path.exists():
-        return None
+    # Go straight for the read; a missing file costs one failed open
+    # instead of a stat on every lookup.
     try:
-        raw = path.read_text(encoding="utf-8")
-        return json.loads(raw)
-    except (OSError, json.JSONDecodeError):
+        return _json_loads(path.read_bytes())
+    except (OSError, ValueError):
         return None
 
 
 def _write_json(path: Path, data: dict[str, Any]) -> None:
-    path.write_text(json.dumps(data, ensure_ascii=True, indent=2), encoding="utf-8")
+    path.write_bytes(_json_dumps(data))
+
+
+_CACHED_KEYS = ("id", "title", "uploader", "duration", "thumbnail", "webpage_url")
+
+
+def _trim_metadata(data: dict[str, Any]) -> dict[str, Any]:
+    # A full yt-dlp info dump runs to hundreds of KB of formats and
+    # subtitle arrays; only the fields _parse_metadata reads are worth
+    # keeping, and trimming makes every later cache read parse a few
+    # hundred bytes instead of the whole blob.
+    return {key: data[key] for key in _CACHED_KEYS if key in data}
+
+
+def _direct_url_from_data(data: dict[str, Any]) -> str | None:
+    requested = data.get("requested_formats")
+    if isinstance(requested, list) and requested:
+        first = requested[0]
+        if isinstance(first, dict):
+            url = _as_str(first.get("url"))
+            if url:
+                return url
+    return _as_str(data.get("url"))
 
 
 def _parse_metadata(data: dict[str, Any], video_id: str) -> VideoMetadata:
@@ -114,16 +114,25 @@ _CLIP_FIELD_ALIASES = {
 }
 
 
+def _tokenize_header(rest: str, line_no: int) -> list[str]:
+    # Most headers carry no quoting, so a plain whitespace split covers
+    # them at C speed; only headers with quotes or escapes pay for the
+    # full shlex lexer.
+    if "'" not in rest and '"' not in rest and "\\" not in rest:
+        return rest.split()
+    try:
+        return shlex.split(rest)
+    except ValueError as exc:
+        raise ValueError(f"Invalid CLIP header on line {line_no}: {exc}") from exc
+
+
 def _parse_clip_header(line: str, line_no: int) -> tuple[str | None, dict[str, str | None]]:
     rest = line.strip()[len("CLIP") :].strip()
     if not rest:
         return None, {}
     if "=" not in rest:
         return rest, {}
-    try:
-        tokens = shlex.split(rest)
-    except ValueError as exc:
-        raise ValueError(f"Invalid CLIP header on line {line_no}: {exc}") from exc
+    tokens = _tokenize_header(rest, line_no)
     tag_parts: list[str] = []
     fields: dict[str, str | None] = {}
     saw_key = False
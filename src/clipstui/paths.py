@@ -1,18 +1,24 @@
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 
 from platformdirs import user_cache_path, user_config_path
 
 APP_NAME = "clipstui"
 
+# The directory helpers are called on every metadata and thumbnail lookup;
+# caching them means the mkdir syscall happens once per process.
 
+
+@functools.lru_cache(maxsize=1)
 def cache_root() -> Path:
     root = user_cache_path(APP_NAME)
     root.mkdir(parents=True, exist_ok=True)
     return root
 
 
+@functools.lru_cache(maxsize=1)
 def config_root() -> Path:
     root = user_config_path(APP_NAME)
     root.mkdir(parents=True, exist_ok=True)
@@ -23,12 +29,14 @@ def config_path() -> Path:
     return config_root() / "config.json"
 
 
+@functools.lru_cache(maxsize=1)
 def metadata_cache_dir() -> Path:
     path = cache_root() / "metadata"
     path.mkdir(parents=True, exist_ok=True)
     return path
 
 
+@functools.lru_cache(maxsize=1)
 def thumbs_cache_dir() -> Path:
     path = cache_root() / "thumbs"
     path.mkdir(parents=True, exist_ok=True)
@@ -39,6 +39,9 @@ _PRESETS = [
 ]
 
 
+_PRESET_INDEX = {preset.name.casefold(): preset for preset in _PRESETS}
+
+
 def list_presets() -> list[PresetProfile]:
     return list(_PRESETS)
 
@@ -47,7 +50,4 @@ def find_preset(name: str) -> PresetProfile | None:
     key = name.strip().casefold()
     if not key:
         return None
-    for preset in _PRESETS:
-        if preset.name.casefold() == key:
-            return preset
-    return None
+    return _PRESET_INDEX.get(key)
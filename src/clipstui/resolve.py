@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import functools
 import re
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from string import Formatter
 from urllib.parse import parse_qs, urlparse
@@ -8,9 +10,10 @@ from urllib.parse import parse_qs, urlparse
 from .parser import ClipSpec
 from .timeparse import format_seconds, get_seconds_from_url
 
-_INVALID_FILENAME_CHARS = set('<>:"/\\|?*')
-_WHITESPACE_RE = re.compile(r"\s+")
-_MULTI_UNDERSCORE_RE = re.compile(r"_+")
+_SANITIZE_TABLE = str.maketrans(
+    {char: "_" for char in '<>:"/\\|?*'} | {chr(code): "_" for code in range(32)}
+)
+_COLLAPSE_RE = re.compile(r"[\s_]+")
 DEFAULT_OUTPUT_TEMPLATE = "{tag}_{videoid}_{start}-{end}"
 _TEMPLATE_FIELDS = {
     "tag",
@@ -86,11 +89,44 @@ def resolve_clip(
     )
 
 
+@functools.lru_cache(maxsize=64)
+def _parsed_template(
+    template: str,
+) -> tuple[tuple[str, str | None, str | None, str | None], ...]:
+    # Batches resolve many clips against one template; parse it once.
+    return tuple(Formatter().parse(template))
+
+
+@functools.lru_cache(maxsize=64)
+def _compiled_template(template: str) -> Callable[[Mapping[str, str]], str]:
+    # Specialize the template into a flat segment walk once; rendering a
+    # clip then skips re-tokenizing the format string entirely.
+    segments = tuple(
+        (literal, field_name) for literal, field_name, _, _ in _parsed_template(template)
+    )
+
+    def render(values: Mapping[str, str]) -> str:
+        parts: list[str] = []
+        append = parts.append
+        for literal, field_name in segments:
+            if literal:
+                append(literal)
+            if field_name is not None:
+                append(values[field_name])
+        return "".join(parts)
+
+    return render
+
+
+@functools.lru_cache(maxsize=64)
+def _template_field_set(template: str) -> frozenset[str]:
+    return frozenset(field_name for _, field_name, _, _ in _parsed_template(template) if field_name)
+
+
 def validate_output_template(template: str) -> None:
     if not template.strip():
         raise ValueError("Output template cannot be empty")
-    formatter = Formatter()
-    for _, field_name, format_spec, conversion in formatter.parse(template):
+    for _, field_name, format_spec, conversion in _parsed_template(template):
         if field_name is None:
             continue
         if not field_name:
@@ -122,7 +158,10 @@ def format_output_basename(
         score=score,
         opponent=opponent,
     )
-    raw = Formatter().vformat(template, (), values)
+    # Validation guarantees named fields without specs or conversions, so
+    # the compiled segment walk replaces Formatter().vformat; missing
+    # fields still resolve to "" through _SafeDict.
+    raw = _compiled_template(template)(values)
     if clip.clip.label and not _template_uses_field(template, "label"):
         raw = f"{raw}_{clip.clip.label}" if raw else clip.clip.label
     return _normalize_basename(raw)
@@ -146,39 +185,35 @@ def _build_output_filename(
     return _normalize_basename(base)
 
 
-def _sanitize_basename(name: str) -> str:
-    cleaned = []
-    for char in name:
-        if char in _INVALID_FILENAME_CHARS or ord(char) < 32:
-            cleaned.append("_")
-        else:
-            cleaned.append(char)
-
-    sanitized = "".join(cleaned)
-    sanitized = _WHITESPACE_RE.sub("_", sanitized)
-    sanitized = sanitized.strip(" ._-")
-    return sanitized or "clip"
-
-
 def _normalize_basename(name: str) -> str:
-    sanitized = _sanitize_basename(name)
-    collapsed = _MULTI_UNDERSCORE_RE.sub("_", sanitized)
-    collapsed = collapsed.strip("._-")
+    # translate replaces invalid and control characters in one C pass;
+    # whitespace and underscore runs then collapse in a single regex pass.
+    sanitized = name.translate(_SANITIZE_TABLE)
+    collapsed = _COLLAPSE_RE.sub("_", sanitized)
+    collapsed = collapsed.strip(" ._-")
     return collapsed or "clip"
 
 
 def _template_uses_field(template: str, field: str) -> bool:
-    formatter = Formatter()
-    for _, field_name, _, _ in formatter.parse(template):
-        if field_name == field:
-            return True
-    return False
+    return field in _template_field_set(template)
+
+
+# Fast-path patterns for the common YouTube URL shapes; the lookaheads
+# ensure a partial id (one containing characters outside the id alphabet)
+# falls through to the full urllib parse instead of being truncated.
+_V_PARAM_RE = re.compile(r"[?&]v=([A-Za-z0-9_-]+)(?=[&#]|$)")
+_PATH_ID_RE = re.compile(r"(?:youtu\.be/|/shorts/|/embed/|/live/)([A-Za-z0-9_-]+)(?=[/?#&]|$)")
 
 
+@functools.lru_cache(maxsize=512)
 def extract_video_id(url: str) -> str:
+    if "%" not in url:
+        match = _V_PARAM_RE.search(url) or _PATH_ID_RE.search(url)
+        if match:
+            return match.group(1)
     parsed = urlparse(url)
     query = parse_qs(parsed.query)
-    if "v" in query and query["v"]:
+    if query.get("v"):
         return query["v"][0]
 
     host = (parsed.hostname or "").lower()
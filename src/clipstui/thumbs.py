@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import atexit
 from pathlib import Path
 import subprocess
 from typing import Callable
@@ -70,11 +71,23 @@ def _guess_extension(url: str) -> str:
     return ".jpg"
 
 
+_client: httpx.Client | None = None
+
+
+def _get_client() -> httpx.Client:
+    # One shared client keeps the TCP/TLS connection to the thumbnail
+    # host pooled across fetches instead of handshaking per thumbnail.
+    global _client
+    if _client is None:
+        _client = httpx.Client(follow_redirects=True, timeout=10.0)
+        atexit.register(_client.close)
+    return _client
+
+
 def _http_fetch(url: str) -> bytes:
-    with httpx.Client(follow_redirects=True, timeout=10.0) as client:
-        response = client.get(url)
-        response.raise_for_status()
-        return response.content
+    response = _get_client().get(url)
+    response.raise_for_status()
+    return response.content
 
 
 def _get_direct_video_url(url: str, runner: Runner) -> str:
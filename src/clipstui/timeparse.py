@@ -1,46 +1,41 @@
 from __future__ import annotations
 
+import functools
 import re
-from decimal import Decimal, InvalidOperation
 from urllib.parse import parse_qs, urlparse
 
-_HMS_RE = re.compile(r"^(?:(\d+)h)?(?:(\d+)m)?(?:(\d+(?:\.\d+)?)s)?$")
-_SECONDS_RE = re.compile(r"^\d+(?:\.\d+)?s?$")
+# One pattern covers all three token syntaxes ([HH:]MM:SS, bare seconds,
+# 1h2m3s); alternation order keeps bare seconds ahead of the h/m/s form.
+_TIME_RE = re.compile(
+    r"^(?:(?P<h1>\d+):)?(?P<m1>\d+):(?P<s1>\d+(?:\.\d+)?)$"
+    r"|^(?P<s2>\d+(?:\.\d+)?)s?$"
+    r"|^(?:(?P<h3>\d+)h)?(?:(?P<m3>\d+)m)?(?:(?P<s3>\d+(?:\.\d+)?)s)?$"
+)
 
 
+@functools.lru_cache(maxsize=2048)
 def convert_time_token_to_seconds(token: str) -> float:
     token = token.strip().lower()
     if not token:
         raise ValueError("Empty time token")
 
-    if ":" in token:
-        parts = token.split(":")
-        if len(parts) == 2:
-            minutes_text, seconds_text = parts
-            hours_text = "0"
-        elif len(parts) == 3:
-            hours_text, minutes_text, seconds_text = parts
-        else:
-            raise ValueError(f"Invalid time token: {token}")
-
-        if not (hours_text.isdigit() and minutes_text.isdigit()):
-            raise ValueError(f"Invalid time token: {token}")
-        seconds_val = _parse_decimal_seconds(seconds_text)
-        hours_val = int(hours_text)
-        minutes_val = int(minutes_text)
-        return _round_seconds(hours_val * 3600 + minutes_val * 60 + seconds_val)
-
-    if _SECONDS_RE.match(token):
-        return _round_seconds(_parse_decimal_seconds(token[:-1] if token.endswith("s") else token))
-
-    match = _HMS_RE.match(token)
-    if match and any(match.groups()):
-        hours_val = int(match.group(1) or 0)
-        minutes_val = int(match.group(2) or 0)
-        seconds_val = float(match.group(3) or 0)
-        return _round_seconds(hours_val * 3600 + minutes_val * 60 + seconds_val)
-
-    raise ValueError(f"Invalid time token: {token}")
+    match = _TIME_RE.match(token)
+    if match is None:
+        raise ValueError(f"Invalid time token: {token}")
+    groups = match.groupdict()
+    if groups["s1"] is not None:
+        hours_val = int(groups["h1"] or 0)
+        minutes_val = int(groups["m1"])
+        seconds_val = float(groups["s1"])
+    elif groups["s2"] is not None:
+        hours_val = 0
+        minutes_val = 0
+        seconds_val = float(groups["s2"])
+    else:
+        hours_val = int(groups["h3"] or 0)
+        minutes_val = int(groups["m3"] or 0)
+        seconds_val = float(groups["s3"] or 0)
+    return _round_seconds(hours_val * 3600 + minutes_val * 60 + seconds_val)
 
 
 def parse_time_delta(token: str) -> float:
@@ -54,6 +49,7 @@ def parse_time_delta(token: str) -> float:
     return _round_seconds(sign * seconds)
 
 
+@functools.lru_cache(maxsize=4096)
 def format_seconds(value: float) -> str:
     if value != value:
         return "0"
@@ -63,7 +59,18 @@ def format_seconds(value: float) -> str:
     return text or "0"
 
 
+_T_PARAM_RE = re.compile(r"[?&]t=([^&#]+)")
+_START_PARAM_RE = re.compile(r"[?&]start=([^&#]+)")
+
+
+@functools.lru_cache(maxsize=2048)
 def get_seconds_from_url(url: str) -> float:
+    # Plain query parameters are pulled out with a regex; URLs carrying
+    # fragments or percent-escapes take the full urllib parse below.
+    if "%" not in url and "#" not in url:
+        match = _T_PARAM_RE.search(url) or _START_PARAM_RE.search(url)
+        if match:
+            return convert_time_token_to_seconds(match.group(1))
     parsed = urlparse(url)
     query_token = _extract_time_token(parse_qs(parsed.query))
     if query_token is None and parsed.fragment:
@@ -83,12 +90,5 @@ def _extract_time_token(query: dict[str, list[str]]) -> str | None:
     return None
 
 
-def _parse_decimal_seconds(value: str) -> float:
-    try:
-        return float(Decimal(value))
-    except (InvalidOperation, ValueError) as exc:
-        raise ValueError(f"Invalid time token: {value}") from exc
-
-
 def _round_seconds(value: float) -> float:
     return round(value, 3)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 
 from rich.text import Text
@@ -9,7 +10,7 @@ from textual.containers import Horizontal, Vertical
 from textual.screen import ModalScreen
 from textual.widgets import Button, Label, Static
 
-from ..fileops_apply import ApplyReport
+from ..fileops_apply import ApplyReport, ApplyStatus
 from ..fileops_plan import Confirmation, Operation, OperationPlan, OperationType
 
 
@@ -59,17 +60,22 @@ class PlanPreviewScreen(ModalScreen[bool]):
         if self._buttons:
             self._buttons[0].focus()
 
+    _APPLY_KEYS = frozenset({"y", "Y", "enter", "return"})
+    _CANCEL_KEYS = frozenset({"n", "N", "escape"})
+    _PREV_KEYS = frozenset({"left", "up"})
+    _NEXT_KEYS = frozenset({"right", "down"})
+
     def on_key(self, event: events.Key) -> None:
-        if event.key in {"y", "Y", "enter", "return"}:
+        if event.key in self._APPLY_KEYS:
             self.dismiss(True)
             event.stop()
-        elif event.key in {"n", "N", "escape"}:
+        elif event.key in self._CANCEL_KEYS:
             self.dismiss(False)
             event.stop()
-        elif event.key in {"left", "up"}:
+        elif event.key in self._PREV_KEYS:
             self._move_focus(-1)
             event.stop()
-        elif event.key in {"right", "down"}:
+        elif event.key in self._NEXT_KEYS:
             self._move_focus(1)
             event.stop()
 
@@ -129,57 +135,79 @@ class ApplyReportScreen(ModalScreen[None]):
 
 
 def _format_plan(root: Path, plan: OperationPlan, confirmations: list[Confirmation]) -> Text:
-    text = Text()
-    if not plan.operations:
-        text.append("No changes detected.")
-        return text
-    for idx, op in enumerate(plan.operations):
+    operations = plan.operations
+    if not operations:
+        return Text("No changes detected.")
+    # Collect all spans first and assemble once; per-operation append
+    # calls re-merge the span list on every call for large plans.
+    spans: list[tuple[str, str] | str] = []
+    last = len(operations) - 1
+    for idx, op in enumerate(operations):
         verb, style = _operation_label(op)
-        text.append(verb, style=style)
-        text.append(" ")
-        text.append(_format_operation(root, op))
-        if idx < len(plan.operations) - 1:
-            text.append("\n")
-    return text
+        spans.append((verb, style))
+        tail = f" {_format_operation(root, op)}"
+        spans.append(tail if idx == last else tail + "\n")
+    return Text.assemble(*spans)
+
+
+_STATUS_UPPER = {status: status.value.upper() for status in ApplyStatus}
 
 
 def _format_report(root: Path, report: ApplyReport) -> str:
-    lines: list[str] = []
-    for result in report.results:
-        status = result.status.value.upper()
-        line = f"{status:7} {_format_operation(root, result.operation)}"
-        if result.message:
-            line = f"{line} | {result.message}"
-        lines.append(line)
-    if not lines:
-        lines.append("No operations executed.")
-    return "\n".join(lines)
+    if not report.results:
+        return "No operations executed."
+    return "\n".join(
+        f"{_STATUS_UPPER[result.status]:7} {_format_operation(root, result.operation)}"
+        + (f" | {result.message}" if result.message else "")
+        for result in report.results
+    )
 
 
 def _format_operation(root: Path, op: Operation) -> str:
-    if op.op_type == OperationType.MOVE and op.source and op.target:
-        return f"{_rel(root, op.source)} -> {_rel(root, op.target)}"
-    if op.op_type in {OperationType.CREATE_DIR, OperationType.CREATE_FILE} and op.target:
-        return _rel(root, op.target)
-    if op.op_type == OperationType.DELETE and op.source:
-        return _rel(root, op.source)
-    return op.op_type.value.upper()
+    # Plans repeat the same roots and paths across preview and report
+    # renders; memoizing on strings keeps the key hashable and cheap.
+    return _format_operation_cached(
+        str(root),
+        op.op_type,
+        str(op.source) if op.source else None,
+        str(op.target) if op.target else None,
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_operation_cached(
+    root_str: str,
+    op_type: OperationType,
+    source_str: str | None,
+    target_str: str | None,
+) -> str:
+    root = Path(root_str)
+    if op_type == OperationType.MOVE and source_str and target_str:
+        return f"{_rel(root, Path(source_str))} -> {_rel(root, Path(target_str))}"
+    if op_type in {OperationType.CREATE_DIR, OperationType.CREATE_FILE} and target_str:
+        return _rel(root, Path(target_str))
+    if op_type == OperationType.DELETE and source_str:
+        return _rel(root, Path(source_str))
+    return op_type.value.upper()
 
 
 def _rel(root: Path, path: Path) -> str:
-    try:
+    # is_relative_to avoids raising ValueError for out-of-root paths.
+    if path.is_relative_to(root):
         return path.relative_to(root).as_posix()
-    except ValueError:
-        return str(path)
+    return str(path)
+
+
+_OP_LABELS = {
+    OperationType.CREATE_DIR: ("MKDIR", "green"),
+    OperationType.CREATE_FILE: ("CREATE", "green"),
+    OperationType.DELETE: ("DELETE", "red"),
+    OperationType.MOVE: ("MOVE", "yellow"),
+}
 
 
 def _operation_label(op: Operation) -> tuple[str, str]:
-    if op.op_type == OperationType.CREATE_DIR:
-        return ("MKDIR", "green")
-    if op.op_type == OperationType.CREATE_FILE:
-        return ("CREATE", "green")
-    if op.op_type == OperationType.DELETE:
-        return ("DELETE", "red")
-    if op.op_type == OperationType.MOVE:
-        return ("MOVE", "yellow")
+    label = _OP_LABELS.get(op.op_type)
+    if label is not None:
+        return label
     return (op.op_type.value.upper(), "white")
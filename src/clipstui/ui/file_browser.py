@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import stat
 from enum import Enum
 from pathlib import Path
@@ -126,6 +127,17 @@ _EXECUTABLE_EXTS = {
     ".sh",
 }
 
+# Icon and icon style fused per extension so a label build hashes the
+# suffix once instead of consulting three tables.
+_EXT_ATTRS = {
+    ext: (
+        _ICON_BY_EXT.get(ext, _FILE_ICON),
+        _EXEC_STYLE if ext in _EXECUTABLE_EXTS else _STYLE_BY_EXT.get(ext, _FILE_ICON_STYLE),
+    )
+    for ext in _ICON_BY_EXT.keys() | _STYLE_BY_EXT.keys() | _EXECUTABLE_EXTS
+}
+_DEFAULT_FILE_ATTRS = (_FILE_ICON, _FILE_ICON_STYLE)
+
 
 class FileEntryKind(Enum):
     UP = "up"
@@ -133,6 +145,9 @@ class FileEntryKind(Enum):
     FILE = "file"
 
 
+_DIR_KINDS = (FileEntryKind.UP, FileEntryKind.DIR)
+
+
 class FileListItem(ListItem):
     def __init__(self, path: Path, kind: FileEntryKind) -> None:
         self.path = path
@@ -141,19 +156,35 @@ class FileListItem(ListItem):
 
 
 def format_file_label(path: Path, kind: FileEntryKind) -> Text:
-    icon = file_icon_for_kind(kind, path)
     name = ".." if kind == FileEntryKind.UP else path.name
-    icon_style = file_icon_style_for_kind(kind, path)
-    text_style = file_text_style_for_kind(kind, path)
+    hidden = kind != FileEntryKind.UP and is_hidden(path)
+    return _build_label(kind, name, hidden).copy()
+
+
+@functools.lru_cache(maxsize=4096)
+def _build_label(kind: FileEntryKind, name: str, hidden: bool) -> Text:
+    # Labels repeat across refreshes and scrolls; build each distinct one
+    # once and hand out copies. The icon and styles depend only on the
+    # kind and suffix, which the name determines, so it keys the cache.
+    icon, icon_style, text_style = _label_attrs(kind, Path(name))
     label = Text()
     label.append(icon, style=icon_style)
     label.append(" ")
     label.append(name, style=text_style)
-    if kind != FileEntryKind.UP and is_hidden(path):
+    if hidden:
         label.stylize(_HIDDEN_STYLE)
     return label
 
 
+def _label_attrs(kind: FileEntryKind, path: Path) -> tuple[str, str, str]:
+    if kind is FileEntryKind.FILE:
+        suffix = path.suffix.lower()
+        icon, icon_style = _EXT_ATTRS.get(suffix, _DEFAULT_FILE_ATTRS)
+        text_style = _CLIP_TEXT_STYLE if suffix == ".clip" else _FILE_TEXT_STYLE
+        return (icon, icon_style, text_style)
+    return (_FOLDER_ICON, _DIR_ICON_STYLE, _DIR_TEXT_STYLE)
+
+
 def path_sort_key(path: Path) -> str:
     return path.name.casefold()
 
@@ -164,7 +195,7 @@ def file_icon_for_kind(
     *,
     expanded: bool | None = None,
 ) -> str:
-    if kind in {FileEntryKind.UP, FileEntryKind.DIR}:
+    if kind in _DIR_KINDS:
         if expanded:
             return _FOLDER_OPEN_ICON
         return _FOLDER_ICON
@@ -181,47 +212,67 @@ def file_icon_for_path(path: Path) -> str:
 
 
 def file_icon_style_for_kind(kind: FileEntryKind, path: Path) -> str:
-    if kind in {FileEntryKind.UP, FileEntryKind.DIR}:
+    if kind in _DIR_KINDS:
         return _DIR_ICON_STYLE
-    ext = path.suffix.lower()
-    if ext in _EXECUTABLE_EXTS:
-        return _EXEC_STYLE
-    return _STYLE_BY_EXT.get(ext, _FILE_ICON_STYLE)
+    return _EXT_ATTRS.get(path.suffix.lower(), _DEFAULT_FILE_ATTRS)[1]
+
+
+_TEXT_STYLE_BY_KIND = {
+    FileEntryKind.UP: _DIR_TEXT_STYLE,
+    FileEntryKind.DIR: _DIR_TEXT_STYLE,
+    FileEntryKind.FILE: _FILE_TEXT_STYLE,
+}
 
 
 def file_text_style_for_kind(kind: FileEntryKind, path: Path | None = None) -> str:
-    if kind in {FileEntryKind.UP, FileEntryKind.DIR}:
-        return _DIR_TEXT_STYLE
-    if path is not None and path.suffix.lower() == ".clip":
+    if kind is FileEntryKind.FILE and path is not None and path.suffix.lower() == ".clip":
         return _CLIP_TEXT_STYLE
-    return _FILE_TEXT_STYLE
+    return _TEXT_STYLE_BY_KIND[kind]
 
 
 def is_hidden(path: Path) -> bool:
     name = path.name
     if name.startswith("."):
         return True
+    return _is_hidden_cached(str(path), _hidden_gen)
+
+
+# Hidden-attribute lookups stat the filesystem, and label rendering asks
+# per entry per refresh. The answer is cached by path string and only
+# re-checked after invalidate_hidden_cache bumps the generation.
+_hidden_gen = 0
+
+
+def invalidate_hidden_cache() -> None:
+    global _hidden_gen
+    _hidden_gen += 1
+
+
+@functools.lru_cache(maxsize=8192)
+def _is_hidden_cached(path_str: str, gen: int) -> bool:
     try:
-        attrs = getattr(path.stat(), "st_file_attributes", 0)
+        attrs = getattr(Path(path_str).stat(), "st_file_attributes", 0)
     except OSError:
         return False
     return bool(attrs & getattr(stat, "FILE_ATTRIBUTE_HIDDEN", 0))
 
 
-def known_file_icons() -> set[str]:
-    icons = set(_ICON_BY_EXT.values())
-    icons.update(
-        {
-            _FOLDER_ICON,
-            _FOLDER_OPEN_ICON,
-            _FILE_ICON,
-            _TEXT_ICON,
-            _VIDEO_ICON,
-            _AUDIO_ICON,
-            _IMAGE_ICON,
-            _ARCHIVE_ICON,
-            _PDF_ICON,
-            _WINDOWS_ICON,
-        }
-    )
-    return icons
+_KNOWN_FILE_ICONS: frozenset[str] = frozenset(
+    {
+        *_ICON_BY_EXT.values(),
+        _FOLDER_ICON,
+        _FOLDER_OPEN_ICON,
+        _FILE_ICON,
+        _TEXT_ICON,
+        _VIDEO_ICON,
+        _AUDIO_ICON,
+        _IMAGE_ICON,
+        _ARCHIVE_ICON,
+        _PDF_ICON,
+        _WINDOWS_ICON,
+    }
+)
+
+
+def known_file_icons() -> frozenset[str]:
+    return _KNOWN_FILE_ICONS
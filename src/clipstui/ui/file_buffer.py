@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+import functools
+import os
+import re
 from pathlib import Path
 
-from rich.text import Text
+from rich.text import Span, Text
 from textual.widgets import TextArea
+from textual.widgets.text_area import Edit, EditResult
 
 from ..file_ops import resolve_user_path
 from ..fileops_plan import DELETE_MARKER, is_delete_marker_line, strip_delete_marker
@@ -16,15 +19,127 @@ from .file_browser import (
     known_file_icons,
 )
 
-_ICON_SET = known_file_icons()
+# Icons are single codepoints; membership on their ordinals hashes a
+# small int instead of a one-character string.
+_ICON_ORDS = frozenset(map(ord, known_file_icons()))
+_DELETE_MARKER_RE = re.compile(r"\s*" + re.escape(DELETE_MARKER) + r"\s*", re.IGNORECASE)
 
 
 def strip_icon_prefix(text: str) -> str:
-    if len(text) >= 2 and text[0] in _ICON_SET and text[1] == " ":
+    # The space check goes first: most lines fail it, skipping the icon
+    # lookup entirely.
+    if len(text) >= 2 and text[1] == " " and ord(text[0]) in _ICON_ORDS:
         return text[2:]
     return text
 
 
+# get_line resolves a kind per visible line per redraw, and each resolve
+# stats the filesystem. Results are cached by (root, line text) plus a
+# generation number; invalidate_resolve_cache bumps the generation when
+# the listing changes so stale kinds do not survive a mutation.
+_resolve_gen = 0
+
+
+def invalidate_resolve_cache() -> None:
+    global _resolve_gen
+    _resolve_gen += 1
+
+
+@functools.lru_cache(maxsize=8192)
+def _join_root(root_str: str, rel_str: str) -> Path:
+    # Joining allocates and normalizes a fresh PurePath; rendered lines
+    # repeat the same root/rel pairs every redraw, so hand back the same
+    # object. Keying on the root string makes root changes self-invalidating.
+    return Path(root_str) / rel_str
+
+
+@functools.lru_cache(maxsize=256)
+def _parent_listing(parent_str: str, gen: int) -> dict[str, bool] | None:
+    # One scandir answers exists/is_dir for every sibling, so a cold
+    # render pass costs one directory read instead of two stats per line.
+    try:
+        with os.scandir(parent_str) as it:
+            return {entry.name: entry.is_dir() for entry in it}
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=2048)
+def _path_is_dir(path_str: str, gen: int) -> bool:
+    parent_str, name = os.path.split(path_str)
+    if not name:
+        try:
+            return Path(path_str).is_dir()
+        except OSError:
+            return False
+    listing = _parent_listing(parent_str, gen)
+    if listing is None:
+        return False
+    return listing.get(name, False)
+
+
+@functools.lru_cache(maxsize=4096)
+def _line_depth_and_remainder(line: str) -> tuple[int, str]:
+    # Content-keyed like _line_positions: the rebuild pass asks about
+    # mostly unchanged lines, and lstrip runs once instead of twice.
+    text = line.rstrip("\n")
+    if is_delete_marker_line(text):
+        text = strip_delete_marker(text)
+    stripped = text.lstrip(" ")
+    depth = (len(text) - len(stripped)) // 2
+    remainder = strip_icon_prefix(stripped).strip()
+    return depth, remainder
+
+
+@functools.lru_cache(maxsize=4096)
+def _line_positions(line: str) -> tuple[int | None, int, int | None]:
+    # Positions depend only on the line content, so the content itself
+    # keys the cache: get_line and every cursor-bound caller re-ask for
+    # the same lines each refresh, and an edited line simply misses.
+    if not line.strip():
+        return (None, 0, None)
+    marker_end = 0
+    if is_delete_marker_line(line):
+        # One anchored match swallows the indent, the marker and the
+        # whitespace after it without allocating an uppercased copy.
+        match = _DELETE_MARKER_RE.match(line)
+        if match is not None:
+            marker_end = match.end()
+    path_start = marker_end
+    icon_index = None
+    indent_end = marker_end
+    while indent_end < len(line) and line[indent_end] == " ":
+        indent_end += 1
+    if indent_end + 1 < len(line):
+        if line[indent_end + 1] == " " and ord(line[indent_end]) in _ICON_ORDS:
+            icon_index = indent_end
+            path_start = indent_end + 2
+    path_end = len(line.rstrip())
+    if path_end <= path_start:
+        return (None, path_end, icon_index)
+    return (path_start, path_end, icon_index)
+
+
+@functools.lru_cache(maxsize=2048)
+def _resolve_kind_cached(
+    root_str: str | None, path_text: str, gen: int
+) -> tuple[FileEntryKind, str | None]:
+    root = Path(root_str) if root_str is not None else None
+    stripped = path_text.strip()
+    if stripped == "..":
+        return (FileEntryKind.UP, str(root.parent) if root is not None else None)
+    is_dir_hint = stripped.endswith(("/", "\\"))
+    trimmed = stripped.rstrip("/\\")
+    if not trimmed:
+        return (FileEntryKind.DIR, root_str)
+    path = resolve_user_path(root, trimmed) if root is not None else Path(trimmed)
+    is_dir = _path_is_dir(str(path), gen)
+    if not is_dir:
+        is_dir = is_dir_hint
+    kind = FileEntryKind.DIR if is_dir else FileEntryKind.FILE
+    return (kind, str(path))
+
+
 class FileBufferTextArea(TextArea):
     def __init__(self, *, root: Path | None = None, **kwargs: object) -> None:
         super().__init__(**kwargs)
@@ -35,6 +150,11 @@ class FileBufferTextArea(TextArea):
         self.visual_line_mode = False
         self.visual_anchor: tuple[int, int] | None = None
         self.visual_cursor: tuple[int, int] | None = None
+        self._rel_cache: dict[int, Path | None] | None = None
+        self._rel_cache_doc: object | None = None
+        # Rebound to the active implementation while a selection exists,
+        # so the common no-selection render skips a method call per line.
+        self._apply_visual_selection = self._apply_visual_selection_noop
 
     def set_root(self, root: Path) -> None:
         self.root = root
@@ -54,6 +174,7 @@ class FileBufferTextArea(TextArea):
         self.visual_line_mode = line_mode
         self.visual_anchor = anchor
         self.visual_cursor = cursor
+        self._apply_visual_selection = self._apply_visual_selection_active
         self.refresh()
 
     def clear_visual_range(self) -> None:
@@ -61,6 +182,7 @@ class FileBufferTextArea(TextArea):
         self.visual_line_mode = False
         self.visual_anchor = None
         self.visual_cursor = None
+        self._apply_visual_selection = self._apply_visual_selection_noop
         self.refresh()
 
     def move_cursor(
@@ -97,58 +219,86 @@ class FileBufferTextArea(TextArea):
 
     def get_line(self, line_index: int) -> Text:
         line_string = self.document.get_line(line_index)
+        if not line_string.strip():
+            # Blank lines outside the visual selection take no styling at
+            # all; skip position parsing and the selection bookkeeping.
+            visual = self.visual_range
+            covered = visual is not None and visual[0] <= line_index <= visual[1]
+            inserting = self.cursor_mode == "insert" and self.cursor_location[0] == line_index
+            if not covered and not inserting:
+                return Text(line_string, end="", no_wrap=True)
         display_line, cursor_mark, insert_index = self._cursor_display_line(
             line_index, line_string
         )
-        text = Text(display_line, end="", no_wrap=True)
-        path_start, path_end, icon_index = self._line_positions(line_string)
-        shift_start = self._shift_start_index(insert_index)
-        shift_end = self._shift_end_index(insert_index)
+        path_start, path_end, icon_index = _line_positions(line_string)
+        ins = insert_index
+        # Spans are collected up front and handed to the Text constructor
+        # in one go; each stylize call would merge the span list again.
+        spans: list[Span] = []
         if path_start is not None:
             path_text = line_string[path_start:path_end].strip()
             if path_text:
                 kind, path = self._resolve_kind_for_line(line_index, path_text)
+                style_path = path if path is not None else Path(path_text)
                 if icon_index is not None:
-                    icon_index = shift_start(icon_index)
-                    icon_style = file_icon_style_for_kind(kind, path or Path(path_text))
-                    text.stylize(icon_style, icon_index, icon_index + 1)
-                text_style = file_text_style_for_kind(kind, path or Path(path_text))
+                    if ins is not None and ins <= icon_index:
+                        icon_index += 1
+                    icon_style = file_icon_style_for_kind(kind, style_path)
+                    spans.append(Span(icon_index, icon_index + 1, icon_style))
+                text_style = file_text_style_for_kind(kind, style_path)
                 if path_start < path_end:
-                    text.stylize(text_style, shift_start(path_start), shift_end(path_end))
+                    start = path_start + (1 if ins is not None and ins <= path_start else 0)
+                    end = path_end + (1 if ins is not None and ins < path_end else 0)
+                    spans.append(Span(start, end, text_style))
                 if path is not None and is_hidden(path):
-                    text.stylize("dim")
+                    spans.append(Span(0, len(display_line), "dim"))
+        text = Text(display_line, end="", no_wrap=True, spans=spans or None)
         self._apply_visual_selection(text, line_index, line_string, insert_index)
         if cursor_mark is not None:
             self._apply_cursor_mark_style(text, cursor_mark)
         return text
 
-    def _apply_visual_selection(
+    def _apply_visual_selection_noop(
+        self,
+        text: Text,
+        line_index: int,
+        line_string: str,
+        insert_index: int | None,
+    ) -> None:
+        return
+
+    def _apply_visual_selection_active(
         self,
         text: Text,
         line_index: int,
         line_string: str,
         insert_index: int | None,
     ) -> None:
-        if self.visual_range is None:
+        visual = self.visual_range
+        if visual is None:
             return
-        start_line, end_line = self.visual_range
+        start_line, end_line = visual
         if line_index < start_line or line_index > end_line:
             return
         plain = text.plain
         if not plain:
+            # Grow through the public API so Rich keeps its caches valid.
+            text.append(" ")
             plain = " "
-            text._text = [plain]
-        if self.visual_line_mode or self.visual_anchor is None or self.visual_cursor is None:
+        length = len(plain)
+        anchor = self.visual_anchor
+        cursor = self.visual_cursor
+        if self.visual_line_mode or anchor is None or cursor is None:
             start_col = 0
             if insert_index is not None and start_col >= insert_index:
                 start_col += 1
-            if start_col >= len(plain):
+            if start_col >= length:
                 return
-            text.stylize("on #2f334d", start_col, len(plain))
+            text.stylize("on #2f334d", start_col, length)
             return
 
-        anchor_row, anchor_col = self.visual_anchor
-        cursor_row, cursor_col = self.visual_cursor
+        anchor_row, anchor_col = anchor
+        cursor_row, cursor_col = cursor
         if line_index < min(anchor_row, cursor_row) or line_index > max(anchor_row, cursor_row):
             return
         min_col = self._min_column_for_row(line_index)
@@ -160,28 +310,28 @@ class FileBufferTextArea(TextArea):
         elif line_index == anchor_row:
             if anchor_row < cursor_row:
                 start_col = anchor_col
-                end_col = len(plain)
+                end_col = length
             else:
                 start_col = 0
                 end_col = anchor_col + 1
         elif line_index == cursor_row:
             if cursor_row < anchor_row:
                 start_col = cursor_col
-                end_col = len(plain)
+                end_col = length
             else:
                 start_col = 0
                 end_col = cursor_col + 1
         else:
             start_col = 0
-            end_col = len(plain)
+            end_col = length
         if insert_index is not None:
             if start_col >= insert_index:
                 start_col += 1
             if end_col >= insert_index:
                 end_col += 1
-        if start_col >= len(plain):
+        if start_col >= length:
             return
-        end_col = max(start_col + 1, min(len(plain), end_col))
+        end_col = max(start_col + 1, min(length, end_col))
         text.stylize("on #2f334d", start_col, end_col)
 
     def _cursor_display_line(
@@ -198,68 +348,20 @@ class FileBufferTextArea(TextArea):
         if cursor_style:
             text.stylize(cursor_style, mark_index, mark_index + 1)
 
-    def _shift_start_index(self, insert_index: int | None) -> Callable[[int], int]:
-        if insert_index is None:
-            return lambda value: value
-        return lambda value: value + (1 if insert_index <= value else 0)
-
-    def _shift_end_index(self, insert_index: int | None) -> Callable[[int], int]:
-        if insert_index is None:
-            return lambda value: value
-        return lambda value: value + (1 if insert_index < value else 0)
-
     def _min_column_for_row(self, row: int) -> int:
-        if row < 0 or row >= self.document.line_count:
+        document = self.document
+        if row < 0 or row >= document.line_count:
             return 0
-        line = self.document.get_line(row)
-        path_start, _path_end, _icon_index = self._line_positions(line)
+        line = document.get_line(row)
+        path_start, _path_end, _icon_index = _line_positions(line)
         if path_start is None:
             return 0
         return path_start
 
-    def _line_positions(self, line: str) -> tuple[int | None, int, int | None]:
-        if not line.strip():
-            return (None, 0, None)
-        marker_end = 0
-        if is_delete_marker_line(line):
-            marker_index = line.upper().find(DELETE_MARKER)
-            if marker_index >= 0:
-                marker_end = marker_index + len(DELETE_MARKER)
-                while marker_end < len(line) and line[marker_end].isspace():
-                    marker_end += 1
-        path_start = marker_end
-        icon_index = None
-        indent_end = marker_end
-        while indent_end < len(line) and line[indent_end] == " ":
-            indent_end += 1
-        if indent_end + 1 < len(line):
-            if line[indent_end] in _ICON_SET and line[indent_end + 1] == " ":
-                icon_index = indent_end
-                path_start = indent_end + 2
-        path_end = len(line.rstrip())
-        if path_end <= path_start:
-            return (None, path_end, icon_index)
-        return (path_start, path_end, icon_index)
-
     def _resolve_kind(self, path_text: str) -> tuple[FileEntryKind, Path | None]:
-        stripped = path_text.strip()
-        if stripped == "..":
-            return (FileEntryKind.UP, self.root.parent if self.root else None)
-        is_dir_hint = stripped.endswith(("/", "\\"))
-        trimmed = stripped.rstrip("/\\")
-        if not trimmed:
-            return (FileEntryKind.DIR, self.root)
-        path = resolve_user_path(self.root, trimmed) if self.root else Path(trimmed)
-        is_dir = False
-        if path.exists():
-            try:
-                is_dir = path.is_dir()
-            except OSError:
-                is_dir = False
-        if not is_dir:
-            is_dir = is_dir_hint
-        kind = FileEntryKind.DIR if is_dir else FileEntryKind.FILE
-        return (kind, path)
+        root_str = str(self.root) if self.root is not None else None
+        kind, path_str = _resolve_kind_cached(root_str, path_text, _resolve_gen)
+        return (kind, Path(path_str) if path_str is not None else None)
 
     def _resolve_kind_for_line(
         self,
@@ -275,49 +377,60 @@ class FileBufferTextArea(TextArea):
         if stripped == "..":
             return (FileEntryKind.UP, self.root.parent if self.root else None)
         is_dir_hint = stripped.endswith(("/", "\\"))
-        path = self.root / rel
-        is_dir = False
-        if path.exists():
-            try:
-                is_dir = path.is_dir()
-            except OSError:
-                is_dir = False
+        path = _join_root(str(self.root), str(rel))
+        is_dir = _path_is_dir(str(path), _resolve_gen)
         if not is_dir:
             is_dir = is_dir_hint
         kind = FileEntryKind.DIR if is_dir else FileEntryKind.FILE
         return (kind, path)
 
+    def edit(self, edit: Edit) -> EditResult:
+        self._rel_cache = None
+        return super().edit(edit)
+
+    def undo(self) -> None:
+        # Undo and redo replay edits without going through edit(), so
+        # they need their own invalidation.
+        self._rel_cache = None
+        super().undo()
+
+    def redo(self) -> None:
+        self._rel_cache = None
+        super().redo()
+
     def _relative_path_for_line(self, line_index: int) -> Path | None:
+        # The stack walk used to restart from line 0 for every queried
+        # line, making a full-viewport render quadratic. One pass now
+        # records every line's path; edits drop the cache (the edit
+        # override covers in-place changes, the identity check covers
+        # document reloads through the text setter).
+        if self._rel_cache is None or self._rel_cache_doc is not self.document:
+            self._rel_cache = self._build_rel_cache()
+            self._rel_cache_doc = self.document
+        return self._rel_cache.get(line_index)
+
+    def _build_rel_cache(self) -> dict[int, Path | None]:
+        cache: dict[int, Path | None] = {}
         stack: list[str] = []
-        for idx in range(self.document.line_count):
-            line = self.document.get_line(idx)
-            depth, remainder = self._line_depth_and_remainder(line)
+        depth_and_remainder = self._line_depth_and_remainder
+        for idx, line in enumerate(self.document.lines):
+            depth, remainder = depth_and_remainder(line)
             if not remainder or remainder == "..":
                 if depth < len(stack):
                     stack = stack[:depth]
-                if idx == line_index:
-                    return None
+                cache[idx] = None
                 continue
             is_dir_hint = remainder.endswith(("/", "\\"))
             name = remainder.rstrip("/\\")
             if depth <= len(stack):
                 stack = stack[:depth]
-            rel = Path(*stack, name)
-            if idx == line_index:
-                return rel
+            cache[idx] = Path(*stack, name)
             if is_dir_hint:
                 if len(stack) == depth:
                     stack.append(name)
                 else:
                     stack = stack[:depth] + [name]
-        return None
+        return cache
 
     def _line_depth_and_remainder(self, line: str) -> tuple[int, str]:
-        text = line.rstrip("\n")
-        if is_delete_marker_line(text):
-            text = strip_delete_marker(text)
-        indent = len(text) - len(text.lstrip(" "))
-        depth = indent // 2
-        remainder = text.lstrip(" ")
-        remainder = strip_icon_prefix(remainder).strip()
-        return depth, remainder
+        return _line_depth_and_remainder(line)
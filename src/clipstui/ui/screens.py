@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import functools
 import os
+import re
 import threading
 from dataclasses import dataclass
 from pathlib import Path
@@ -1798,6 +1800,7 @@ def _build_search_index(
     return (candidates, False)
 
 
+@functools.lru_cache(maxsize=4096)
 def _score_search_path(path: Path, root: Path, query_lower: str) -> int | None:
     rel_text = _relative_display(root, path).lower()
     name_lower = path.name.lower()
@@ -1834,15 +1837,21 @@ def _relative_display(root: Path, path: Path) -> str:
     return str(relative) if str(relative) else "."
 
 
+@functools.lru_cache(maxsize=256)
+def _fuzzy_query_pattern(query: str) -> re.Pattern[str]:
+    return re.compile(".*?".join(f"({re.escape(char)})" for char in query), re.DOTALL)
+
+
 def _fuzzy_score(candidate: str, query: str) -> int | None:
     if not query:
         return None
+    match = _fuzzy_query_pattern(query).search(candidate)
+    if match is None:
+        return None
     pos = -1
     score = 0
-    for char in query:
-        idx = candidate.find(char, pos + 1)
-        if idx < 0:
-            return None
+    for group in range(1, len(query) + 1):
+        idx = match.start(group)
         score += idx
         if idx == pos + 1:
             score -= 5
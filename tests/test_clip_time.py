@@ -1,4 +1,5 @@
-from clipstui.clip_time import coerce_time_input, extract_youtube_urls
+from clipstui import clip_time
+from clipstui.clip_time import coerce_time_input, extract_youtube_urls, replace_url_time
 
 
 def test_coerce_time_input_token_uses_base_url() -> None:
@@ -15,6 +16,29 @@ def test_coerce_time_input_delta() -> None:
     assert "t=12.5" in url
 
 
+def test_replace_url_time_fast_matches_fallback(monkeypatch) -> None:
+    urls = [
+        "https://www.youtube.com/watch?v=abc123&t=10",
+        "https://www.youtube.com/watch?t=10&v=abc123",
+        "https://www.youtube.com/watch?v=abc123&start=10",
+        "https://youtu.be/abc123?t=10",
+        "https://www.youtube.com/watch?v=abc123",
+    ]
+    fast_results = [replace_url_time(url, 75) for url in urls]
+    monkeypatch.setattr(clip_time, "_replace_url_time_fast", lambda url, seconds: None)
+    fallback_results = [replace_url_time(url, 75) for url in urls]
+    assert fast_results == fallback_results
+
+
+def test_replace_url_time_unusual_urls_use_fallback() -> None:
+    # Fragments, escaped params and repeated keys are outside the fast
+    # path; they must still come back with the time swapped.
+    assert clip_time._replace_url_time_fast("https://youtu.be/abc123?t=10#frag", 75) is None
+    assert "t=75" in replace_url_time("https://youtu.be/abc123?t=10#frag", 75)
+    assert "t=75" in replace_url_time("https://youtu.be/abc123?t=10&t=20", 75)
+    assert "t=75" in replace_url_time("https://youtu.be/abc123?q=a%20b&t=10", 75)
+
+
 def test_extract_youtube_urls() -> None:
     text = "watch https://youtu.be/abc123?t=1 and https://example.com"
     urls = extract_youtube_urls(text)
@@ -1,4 +1,5 @@
 import csv
+import io
 import json
 from pathlib import Path
 
@@ -7,6 +8,7 @@ from clipstui.exports import (
     build_manifest_entries,
     manifest_to_csv,
     manifest_to_json,
+    manifest_write_csv,
 )
 from clipstui.metadata import VideoMetadata
 from clipstui.parser import ClipSpec
@@ -105,6 +107,37 @@ def test_manifest_to_csv() -> None:
     assert rows[0]["output_file"].endswith(".mp4")
 
 
+def test_manifest_write_csv_quotes_and_crlf() -> None:
+    clip = ClipSpec(
+        start_url="https://www.youtube.com/watch?v=abc123&t=10",
+        end_url="https://www.youtube.com/watch?v=abc123&t=20",
+        tag="C001",
+        score="22-20",
+        opponent='Old, Dominion "ODU"',
+    )
+    resolved = resolve_clip(clip, pad_before=0, pad_after=0)
+    entries = build_manifest_entries(
+        [resolved],
+        output_dir=Path("out"),
+        output_format="mp4",
+        output_template="{tag}_{videoid}_{start}-{end}",
+        metadata={},
+    )
+    buffer = io.StringIO()
+    manifest_write_csv(entries, buffer)
+    text = buffer.getvalue()
+
+    lines = text.split("\r\n")
+    assert lines[-1] == ""
+    assert len(lines) == 3
+    assert "\n" not in text.replace("\r\n", "")
+    assert '"Old, Dominion ""ODU"""' in lines[1]
+
+    rows = list(csv.DictReader(io.StringIO(text)))
+    assert rows[0]["opponent"] == 'Old, Dominion "ODU"'
+    assert rows[0]["score"] == "22-20"
+
+
 def test_manifest_to_json() -> None:
     resolved = resolve_clip(_sample_clip(), pad_before=0, pad_after=0)
     output_dir = Path("out")
@@ -33,6 +33,39 @@ def test_apply_plan_swaps_files(tmp_path: Path) -> None:
     assert b_path.read_text() == "A"
 
 
+def test_apply_plan_rotates_files_through_cycle(tmp_path: Path) -> None:
+    root = tmp_path
+    a_path = root / "a.txt"
+    b_path = root / "b.txt"
+    c_path = root / "c.txt"
+    a_path.write_text("A")
+    b_path.write_text("B")
+    c_path.write_text("C")
+
+    # Every target is another move's source, so ordering alone cannot
+    # schedule these; the cycle has to be broken through a temp path.
+    operations = [
+        Operation(OperationType.MOVE, source=a_path, target=b_path, is_dir=False),
+        Operation(OperationType.MOVE, source=b_path, target=c_path, is_dir=False),
+        Operation(OperationType.MOVE, source=c_path, target=a_path, is_dir=False),
+    ]
+    plan = OperationPlan(
+        root=root,
+        operations=operations,
+        original_entries=[],
+        edited_entries=[],
+        delete_markers=[],
+        parse_errors=[],
+    )
+
+    report = apply_plan(plan)
+
+    assert report.error_count == 0
+    assert a_path.read_text() == "C"
+    assert b_path.read_text() == "A"
+    assert c_path.read_text() == "B"
+
+
 def test_apply_plan_deletes_non_empty_directory(tmp_path: Path) -> None:
     root = tmp_path
     dir_path = root / "folder"
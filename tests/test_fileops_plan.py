@@ -45,6 +45,52 @@ def test_compute_plan_rename_move_create(tmp_path: Path) -> None:
     assert deletes == []
 
 
+def test_compute_plan_reorder_is_noop(tmp_path: Path) -> None:
+    root = tmp_path
+    (root / "a.txt").write_text("a")
+    (root / "b.txt").write_text("b")
+
+    original = [
+        PathEntry(root / "a.txt", False),
+        PathEntry(root / "b.txt", False),
+    ]
+    edited = ["b.txt", "a.txt"]
+
+    plan = compute_plan(root, original, edited)
+
+    assert plan.operations == []
+
+
+def test_compute_plan_cross_region_rename_stays_delete(tmp_path: Path) -> None:
+    root = tmp_path
+    (root / "a.txt").write_text("a")
+    (root / "keep.txt").write_text("k")
+    (root / "b.txt").write_text("b")
+
+    original = [
+        PathEntry(root / "a.txt", False),
+        PathEntry(root / "keep.txt", False),
+        PathEntry(root / "b.txt", False),
+    ]
+    # a.txt is removed before the keep.txt anchor while the rename sits
+    # after it; the removal must not be paired with the other region's
+    # new name.
+    edited = ["keep.txt", "b_renamed.txt"]
+
+    plan = compute_plan(root, original, edited)
+    moves = [op for op in plan.operations if op.op_type == OperationType.MOVE]
+    deletes = [op for op in plan.operations if op.op_type == OperationType.DELETE]
+    creates = [op for op in plan.operations if op.op_type == OperationType.CREATE_FILE]
+
+    assert [op.source.name for op in deletes if op.source] == ["a.txt"]
+    assert [
+        (_rel(root, op.source), _rel(root, op.target))
+        for op in moves
+        if op.source and op.target
+    ] == [("b.txt", "b_renamed.txt")]
+    assert creates == []
+
+
 def test_compute_plan_delete_missing(tmp_path: Path) -> None:
     root = tmp_path
     (root / "a.txt").write_text("a")